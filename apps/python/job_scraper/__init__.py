@@ -1,23 +1,31 @@
 """Command-line interface for running job scrapers."""
 
+from __future__ import annotations
+
 import argparse
+import atexit
+import functools
 import logging
+import math
+import os
+import queue
+import statistics
 import sys
 import time
-import random
 import threading
 from .db.connector import DatabaseConnector
-from .scrapers.jobsdb import JobsdbScraper
-import os
-import tempfile
-import json
-from scrapy.crawler import CrawlerProcess
-from scrapy.utils.project import get_project_settings
-from .scrapers.jobsdb_spider import JobsDBSpider
+from .batch_writer import BatchWriter
+from .detail_cache import JobDetailCache
+from .rate_limiter import RateLimiter
 from .models.job import Company, Job
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple
+
+# Scrapy/Twisted and Selenium are slow to import; load them only when used
+if TYPE_CHECKING:
+    from .scrapers.jobsdb import JobsdbScraper
 
 # Configure logging
 logging.basicConfig(
@@ -29,171 +37,654 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logging.getLogger("WDM").setLevel(logging.WARNING)
 
+# Shared DatabaseConnector; its engine pool hands out connections to workers
+_db: Optional[DatabaseConnector] = None
+_db_lock = threading.Lock()
+
+
+def _get_db(pool_size: Optional[int] = None) -> DatabaseConnector:
+    """Return the process-wide DatabaseConnector, creating it on first use.
+
+    Args:
+        pool_size: Connection pool size used if the connector is created now.
+
+    Returns:
+        The shared DatabaseConnector instance.
+    """
+    global _db
+    if _db is None:
+        with _db_lock:
+            if _db is None:
+                _db = DatabaseConnector(pool_size=pool_size)
+    return _db
+
+
+# On-disk cache of scraped descriptions, shared by all workers
+_detail_cache: Optional[JobDetailCache] = None
+
+
+def _get_detail_cache() -> JobDetailCache:
+    """Return the process-wide JobDetailCache, opening it on first use."""
+    global _detail_cache
+    if _detail_cache is None:
+        with _db_lock:
+            if _detail_cache is None:
+                _detail_cache = JobDetailCache()
+    return _detail_cache
+
+
+# Caps detail requests to JobsDB across all workers (see --rps)
+DEFAULT_RPS = 5.0
+# Limiter for one-off requests outside a scrape_job_details run, which
+# builds its own from ``rps``
+_rate_limiter = RateLimiter(DEFAULT_RPS)
+
+
+# One JobsdbScraper (and its browser session) per worker thread
+_thread_local = threading.local()
+_open_scrapers: List[JobsdbScraper] = []  # Every thread's scraper, for cleanup
+
+
+def _get_thread_scraper() -> JobsdbScraper:
+    """Return the calling thread's JobsdbScraper, creating it on first use.
+
+    WebDriver sessions are not thread-safe, so each worker thread keeps its own
+    scraper and reuses the open browser, with its keep-alive connections to
+    JobsDB, for every job it processes.
+
+    Returns:
+        The JobsdbScraper bound to the current thread.
+    """
+    scraper = getattr(_thread_local, "scraper", None)
+    if scraper is None or scraper.driver is None:  # None or closed
+        from .scrapers.jobsdb import JobsdbScraper
+
+        scraper = JobsdbScraper()
+        _thread_local.scraper = scraper
+        with _db_lock:
+            _open_scrapers.append(scraper)
+    return scraper
+
+
+def _close_thread_scrapers() -> None:
+    """Quit every browser opened by _get_thread_scraper."""
+    with _db_lock:
+        scrapers = list(_open_scrapers)
+        _open_scrapers.clear()
+    for scraper in scrapers:
+        try:
+            scraper.close()
+        except Exception as e:
+            logger.warning(f"Error closing scraper: {e}")
+
+
+# Browsers opened outside scrape_job_details (e.g. update_job_description) or
+# left behind by an interrupted run are quit when the interpreter exits
+atexit.register(_close_thread_scrapers)
+
+
+class _JobLogAdapter(logging.LoggerAdapter):
+    """Prefix messages with the worker thread and job ID.
+
+    The prefix is only formatted for records that pass the level check, so
+    per-job debug lines cost nothing at the default INFO level.
+    """
+
+    def process(self, msg, kwargs):
+        tid, jid = self.extra["tid"], self.extra["jid"]
+        prefix = f"[Thread-{tid} Job-{jid}]" if tid else f"[Job-{jid}]"
+        return f"{prefix} {msg}", kwargs
+
+
+def _job_logger(job_id, thread: bool = True) -> logging.LoggerAdapter:
+    """Return a logger that tags messages with the job (and current thread) ID."""
+    extra = {"jid": job_id, "tid": threading.get_ident() if thread else None}
+    return _JobLogAdapter(logger, extra)
+
+
+def _worker_scrape(
+    job_id: int, force_rescrape: bool, rate_limiter: RateLimiter
+) -> Tuple[bool, Optional[str]]:
+    """Scrape details for one job.
+
+    The worker never touches the database; the caller collects the returned
+    descriptions and writes them in bulk.
+
+    Args:
+        job_id: JobsDB job ID to scrape
+        force_rescrape: Skip the on-disk detail cache
+        rate_limiter: The run's limiter, shared by all of its workers
 
-def _worker_scrape(job_id: int, save: bool) -> bool:
-    """Scrape details for one job and optionally save; return True on success."""
-    thread_id = threading.get_ident()  # Get current thread ID
-    log_prefix = f"[Thread-{thread_id} Job-{job_id}]"  # Create a log prefix
+    Returns:
+        Tuple of (success, description to store). The description is the
+        scraped text on success, or an "N/A"/"Error: ..." placeholder on failure.
+    """
+    log = _job_logger(job_id)
 
-    db = (
-        DatabaseConnector()
-    )  # Consider if DB connection pooling is needed for many workers
-    scraper = JobsdbScraper()  # Instantiated per call, might be okay
+    cache = _get_detail_cache()
     try:
-        # --- Add random delay ---
-        delay = random.uniform(1.0, 3.0)
-        logger.debug(f"{log_prefix} Sleeping for {delay:.2f} seconds")
-        time.sleep(delay)
-        # --- End delay ---
+        cached_description = None if force_rescrape else cache.get(job_id)
+        if cached_description is not None:
+            # Only valid descriptions are cached; no need to build a Job
+            log.debug("Using cached description.")
+            return True, cached_description
 
-        logger.debug(f"{log_prefix} Requesting details")
-        details = scraper.get_job_details(job_id)
+        scraper = _get_thread_scraper()  # Reused for every job on this thread
 
+        # The shared limiter spaces requests across all workers, so no
+        # per-worker random delay is needed
+        log.debug("Requesting details")
+        with rate_limiter:
+            details = scraper.get_job_details(job_id)
         if details and details.description and details.description != "N/A":
-            logger.debug(f"{log_prefix} Found description.")
-            if save:
-                logger.debug(f"{log_prefix} Attempting to save description.")
-                success = db.update_job_description(job_id, details.description)
-                if success:
-                    logger.debug(f"{log_prefix} Save successful.")
-                    return True
-                else:
-                    logger.error(f"{log_prefix} Failed to save description to DB.")
-                    return False
-            else:
-                logger.debug(
-                    f"{log_prefix} Preview mode, description found but not saving."
-                )
-                return True  # Preview successful if description found
-
-        elif details:  # Description was None or "N/A"
-            logger.warning(f"{log_prefix} Scraped empty/NA description.")
-            if save:
-                logger.debug(f"{log_prefix} Saving 'N/A' as description.")
-                db.update_job_description(job_id, "N/A")  # Save N/A placeholder
-            return False  # Indicate failure as no valid description was found/saved
-        else:  # details was None (scraping failed)
-            ## logger.warning(f"{log_prefix} scraper.get_job_details returned None.")
-            if save:
-                logger.debug(
-                    f"{log_prefix} Saving 'Error: Scrape Failed' as description."
-                )
-                db.update_job_description(
-                    job_id, "Error: Scrape Failed"
-                )  # Indicate scrape error
-            return False  # Indicate failure
+            cache.set(job_id, details.description)
+
+        return _details_outcome(details, log)
 
     except Exception as e:
-        logger.error(
-            f"{log_prefix} Unexpected error: {e}", exc_info=True
-        )  # Log exception details
-        # Optionally, update DB with error status if saving
-        if save:
-            try:  # Nested try/except for DB update during error handling
-                db.update_job_description(job_id, f"Error: {type(e).__name__}")
-                logger.debug(f"{log_prefix} Saved error status to DB.")
-            except Exception as db_err:
-                logger.error(
-                    f"{log_prefix} Failed to save error status to DB: {db_err}"
-                )
-        return False
+        log.error(f"Unexpected error: {e}", exc_info=True)  # Log exception details
+        return False, f"Error: {type(e).__name__}"
 
 
-def run_jobsdb_spider(job_category=None, job_type=None, sortmode="listed_date", page=1):
-    """Run JobsDB spider and return the results as Job objects.
+def _details_outcome(
+    details: Optional[Job], log: logging.LoggerAdapter
+) -> Tuple[bool, Optional[str]]:
+    """Map a scraped Job (or None) to the (success, description) worker result."""
+    if details and details.description and details.description != "N/A":
+        log.debug("Found description.")
+        return True, details.description
+
+    elif details:  # Description was None or "N/A"
+        log.debug("Scraped empty/NA description.")  # Counted as a failure
+        return False, "N/A"  # N/A placeholder, no valid description found
+    else:  # details was None (scraping failed)
+        ## log.warning("scraper.get_job_details returned None.")
+        return False, "Error: Scrape Failed"  # Indicate scrape error
+
+
+def _new_event_loop():
+    """Create an event loop, using uvloop's libuv-based loop when installed."""
+    import asyncio
+
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _iter_completed_async(
+    job_ids: List[int],
+    concurrency: int,
+    rate_limiter: RateLimiter,
+    force_rescrape: bool = False,
+) -> Iterator[Tuple[int, "asyncio.Task"]]:
+    """Fetch job details over plain HTTP with aiohttp instead of Selenium.
+
+    An event loop on a background thread (uvloop if it is installed) keeps up
+    to ``concurrency`` requests in flight over one pooled connector, still
+    subject to the shared rate limiter and detail cache. Results are handed
+    back as each request finishes, so the caller can log and save while
+    others are running.
+
+    Args:
+        job_ids: JobsDB job IDs to scrape
+        concurrency: Maximum number of simultaneous requests
+        rate_limiter: The run's limiter; every request takes a token from it
+        force_rescrape: Skip the on-disk detail cache
+
+    Yields:
+        ``(job_id, task)`` pairs in completion order; each task's ``result()``
+        is the same ``(success, description)`` tuple ``_worker_scrape`` returns.
+    """
+    import asyncio
+
+    import aiohttp
+
+    from .scrapers.jobsdb import fetch_job_details
+
+    cache = _get_detail_cache()
+    completed: queue.Queue = queue.Queue()
+
+    async def fetch_one(session, semaphore, job_id):
+        log = _job_logger(job_id, thread=False)
+        cached_description = None if force_rescrape else cache.get(job_id)
+        if cached_description is not None:
+            log.debug("Using cached description.")
+            return True, cached_description
+
+        async with semaphore:
+            # The limiter blocks, so wait for a token off the event loop
+            await asyncio.to_thread(rate_limiter.acquire)
+            details = await fetch_job_details(session, job_id)
+        if details and details.description and details.description != "N/A":
+            cache.set(job_id, details.description)
+        return _details_outcome(details, log)
+
+    async def run():
+        semaphore = asyncio.Semaphore(concurrency)
+        # One keep-alive pool for every request, with cached DNS lookups
+        connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            tasks = []
+            for jid in job_ids:
+                task = asyncio.ensure_future(fetch_one(session, semaphore, jid))
+                task.add_done_callback(lambda t, jid=jid: completed.put((jid, t)))
+                tasks.append(task)
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def run_loop():
+        loop = _new_event_loop()
+        try:
+            loop.run_until_complete(run())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        except Exception as e:
+            logger.error(f"Async detail scraping stopped: {e}", exc_info=True)
+        finally:
+            loop.close()
+            completed.put(None)  # Every done callback has already run
+
+    loop_thread = threading.Thread(target=run_loop, name="details-event-loop", daemon=True)
+    loop_thread.start()
+    try:
+        while True:
+            result = completed.get()
+            if result is None:
+                return
+            yield result
+    finally:
+        loop_thread.join()
+
+
+# Worker auto-sizing: aim for SCRAPER_TARGET_RPS requests/second in total
+DEFAULT_TARGET_RPS = 1.0
+MAX_AUTO_WORKERS = 50
+PROBE_JOB_COUNT = 3
+# Runs with fewer jobs than this are not probed
+PROBE_MIN_JOBS = 10
+# Worker count when the probe is skipped or fails
+DEFAULT_MAX_WORKERS = 5
+
+
+def _probe_max_workers(
+    job_ids: List[int], rate_limiter: RateLimiter
+) -> Tuple[int, List[Tuple[int, bool, Optional[str]]]]:
+    """Choose a worker count from the latency of a few serial detail fetches.
+
+    Fetches up to PROBE_JOB_COUNT jobs one after another (each through
+    ``rate_limiter``), takes the median latency ``L`` and uses
+    ``ceil(target_rps * L)`` workers, capped at MAX_AUTO_WORKERS. Runs of
+    fewer than PROBE_MIN_JOBS jobs are not probed, and a failing probe falls
+    back to DEFAULT_MAX_WORKERS instead of aborting the run.
+
+    Args:
+        job_ids: Job IDs about to be scraped; the first few are used as probes
+        rate_limiter: The run's limiter, shared with the workers that follow
+
+    Returns:
+        Tuple of (number of workers, results of the probed jobs). Each result
+        is a ``(job_id, success, description)`` tuple like the workers
+        produce, so the caller can record those jobs instead of fetching
+        them again.
+    """
+    if len(job_ids) < PROBE_MIN_JOBS:
+        return DEFAULT_MAX_WORKERS, []
+
+    target_rps = float(os.environ.get("SCRAPER_TARGET_RPS", DEFAULT_TARGET_RPS))
+    cache = _get_detail_cache()
+
+    probed = []
+    latencies = []
+    for job_id in job_ids[:PROBE_JOB_COUNT]:
+        log = _job_logger(job_id)
+        try:
+            scraper = _get_thread_scraper()
+            with rate_limiter:
+                started = time.monotonic()  # Time the fetch, not the token wait
+                details = scraper.get_job_details(job_id)
+                latencies.append(time.monotonic() - started)
+        except Exception as e:
+            log.error(f"Latency probe failed: {e}", exc_info=True)
+            probed.append((job_id, False, f"Error: {type(e).__name__}"))
+            logger.warning(
+                f"Could not probe detail latency; using {DEFAULT_MAX_WORKERS} workers."
+            )
+            return DEFAULT_MAX_WORKERS, probed
+
+        if details and details.description and details.description != "N/A":
+            cache.set(job_id, details.description)
+        probed.append((job_id, *_details_outcome(details, log)))
+
+    latency = statistics.median(latencies)
+    max_workers = max(1, min(math.ceil(target_rps * latency), MAX_AUTO_WORKERS))
+    logger.info(
+        f"Probed detail latency {latency:.2f}s at target {target_rps} req/s -> using {max_workers} workers "
+        f"(pass --max_workers {max_workers} to pin this value)."
+    )
+    return max_workers, probed
+
+
+def _iter_completed(
+    executor: ThreadPoolExecutor, fn, job_ids: Iterable, window: int, *args
+) -> Iterator[Tuple[object, object]]:
+    """Run ``fn(job_id, *args)`` for every job ID, yielding results as they finish.
+
+    Only ``window`` jobs are queued on the executor at any time; the next job ID
+    is submitted as soon as one completes, so large ID lists are consumed lazily
+    instead of creating a future for every job up front.
+
+    Yields:
+        ``(job_id, future)`` pairs in completion order.
+    """
+    job_iter = iter(job_ids)
+    pending = {executor.submit(fn, jid, *args): jid for jid in islice(job_iter, window)}
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for fut in done:
+            jid = pending.pop(fut)
+            for next_jid in islice(job_iter, 1):
+                pending[executor.submit(fn, next_jid, *args)] = next_jid
+            yield jid, fut
+
+
+def _item_to_row(item, scraped_at: Optional[str] = None) -> Optional[dict]:
+    """Map one JobsDB spider item to jobs-table columns, or None if incomplete.
+
+    Args:
+        item: Spider item (dict or scrapy Item)
+        scraped_at: Fallback date_scraped for items without one; computed
+            once per crawl by the caller (default: now)
+    """
+    get = item.get  # Bound once; called for every column below
+
+    # Ensure company is handled correctly
+    company_data = get("company", {})
+    company_name_str = (
+        company_data.get("name", "Unknown Company")
+        if isinstance(company_data, dict)
+        else str(company_data)
+    )
+
+    # Keep the spider's ISO timestamp as-is; date_scraped is stored as text
+    date_scraped = get("date_scraped") or scraped_at
+    if not date_scraped:
+        date_scraped = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+
+    job_id = get("id")
+    row = {
+        "id": str(job_id) if job_id else None,
+        "name": get("title", "Unknown Title"),
+        "description": "",  # Empty description for search results
+        "company_name": company_name_str,  # Use extracted string
+        "location": get("location", "Unknown Location"),
+        "source": "Jobsdb",
+        "date_scraped": date_scraped,
+        # "date_posted": get("date_posted"), # Uncomment if available
+        # "work_type": get("work_type"), # Uncomment if available
+        "salary_description": get("salary_description", "N/A"),
+        "job_class": get("job_class", "N/A"),
+        # "job_subclass": get("job_subclass"), # Uncomment if available
+        # "other": get("other"), # Uncomment if available
+        # "remark": get("remark") # Uncomment if available
+    }
+    # Validate essential fields before returning
+    if row["id"] and row["name"]:
+        return row
+    logger.warning(f"Skipping job item due to missing ID or Title: {item}")
+    return None
+
+
+# Validate a whole list of row dicts into Jobs in one call
+try:  # pydantic v2: a single pass through the compiled validator
+    from pydantic import TypeAdapter
+
+    _validate_jobs = TypeAdapter(List[Job]).validate_python
+except ImportError:  # pydantic v1
+    from pydantic import parse_obj_as
+
+    _validate_jobs = functools.partial(parse_obj_as, List[Job])
+
+
+# Throughput settings for the single-domain JobsDB crawl; AutoThrottle backs
+# off if the server starts responding slowly
+SCRAPY_THROUGHPUT_SETTINGS = {
+    "DOWNLOAD_DELAY": 0.1,
+    "AUTOTHROTTLE_ENABLED": True,
+    "AUTOTHROTTLE_TARGET_CONCURRENCY": 8,
+    "CONCURRENT_ITEMS": 100,
+    "REACTOR_THREADPOOL_MAXSIZE": 20,
+}
+
+_base_settings = None
+
+
+def _get_base_settings():
+    """Return a fresh copy of the project settings, loading them only once."""
+    global _base_settings
+    if _base_settings is None:
+        from scrapy.utils.project import get_project_settings
+
+        _base_settings = get_project_settings()
+    return _base_settings.copy()
+
+
+# Rows buffered between the crawler process and the caller
+SPIDER_QUEUE_SIZE = 10000
+
+
+def _crawl_jobsdb(
+    item_queue, settings_overrides: dict, pages: List[int], spider_kwargs: dict
+) -> None:
+    """Child-process entry point: crawl JobsDB and stream rows into a queue.
+
+    Every scraped item is mapped to a jobs-table row and put on ``item_queue``;
+    a final ``None`` marks the end of the crawl (also after a failure).
+
+    Args:
+        item_queue: multiprocessing.Queue shared with the parent
+        settings_overrides: Scrapy settings applied on top of the project's
+        pages: Page numbers to crawl
+        spider_kwargs: Arguments passed to every JobsDBSpider crawl
+    """
+    try:
+        # Configure Scrapy settings
+        settings = _get_base_settings()
+        settings.update(settings_overrides)
+
+        from scrapy import signals
+        from scrapy.crawler import CrawlerProcess
+
+        from .scrapers.jobsdb_spider import JobsDBSpider
+
+        # Initialize the Scrapy process
+        process = CrawlerProcess(settings)
+        scraped_at = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+
+        # Map items to rows as they are scraped and hand them to the parent
+        def collect_item(item, **kwargs):
+            row = _item_to_row(item, scraped_at)  # Items are read-only here; no copy
+            if row:
+                item_queue.put(row)
+
+        # Schedule one crawl per page; they all run on the same reactor
+        for page_number in pages:
+            crawler = process.create_crawler(JobsDBSpider)
+            # collect_item stays referenced until we return, so the weak ref holds
+            crawler.signals.connect(collect_item, signal=signals.item_scraped)
+            process.crawl(crawler, page=page_number, **spider_kwargs)
+
+        # Run the spiders and wait for all of them to finish
+        process.start()
+    finally:
+        item_queue.put(None)
+
+
+def iter_jobsdb_spider(
+    job_category=None,
+    job_type=None,
+    sortmode="listed_date",
+    pages: Iterable[int] = (1,),
+    concurrent_requests=32,
+    concurrent_requests_per_domain=16,
+) -> Iterator[dict]:
+    """Crawl JobsDB in a child process and yield jobs-table rows as they arrive.
+
+    The Twisted reactor runs in its own process, so it can be started once per
+    call, and the caller can save rows while the crawl is still going.
 
     Args:
         job_category: Category to search in (e.g., "software")
         job_type: Type of job (default: None)
         sortmode: Sorting method (default: "listed_date")
-        page: Page number (default: 1)
+        pages: Page numbers to crawl (default: page 1 only)
+        concurrent_requests: Scrapy CONCURRENT_REQUESTS (default: 32)
+        concurrent_requests_per_domain: Scrapy CONCURRENT_REQUESTS_PER_DOMAIN
+            (default: 16)
 
-    Returns:
-        List of Job objects
+    Yields:
+        Row dicts that can be passed straight to ``DatabaseConnector.save_jobs``
     """
-    # Create a temporary file to store the results
-    output_file = tempfile.mktemp(suffix=".json")
+    import multiprocessing
 
-    # Configure Scrapy settings
-    settings = get_project_settings()
-    settings.update(
-        {
-            "FEED_FORMAT": "json",
-            "FEED_URI": f"file://{output_file}",
-            "LOG_LEVEL": "INFO",
-        }
+    settings_overrides = {
+        **SCRAPY_THROUGHPUT_SETTINGS,
+        "CONCURRENT_REQUESTS": concurrent_requests,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": concurrent_requests_per_domain,
+        "LOG_LEVEL": "INFO",
+    }
+    spider_kwargs = {
+        "job_category": job_category,
+        "job_type": job_type,
+        "sortmode": sortmode,
+    }
+
+    item_queue = multiprocessing.Queue(maxsize=SPIDER_QUEUE_SIZE)
+    crawl = multiprocessing.Process(
+        target=_crawl_jobsdb,
+        args=(item_queue, settings_overrides, list(pages), spider_kwargs),
+        name="jobsdb-crawler",
+        daemon=True,
     )
+    crawl.start()
+    try:
+        while True:
+            try:
+                row = item_queue.get(timeout=1.0)
+            except queue.Empty:
+                if not crawl.is_alive():
+                    logger.error("Crawler process exited without finishing.")
+                    return
+                continue
+            if row is None:  # End of crawl
+                return
+            yield row
+    finally:
+        crawl.join(timeout=10)
+        if crawl.is_alive():
+            crawl.terminate()
+            crawl.join()
 
-    # Initialize the Scrapy process
-    process = CrawlerProcess(settings)
 
-    # Start the spider
-    process.crawl(
-        JobsDBSpider,
-        job_category=job_category,
-        job_type=job_type,
-        sortmode=sortmode,
-        page=page,
+def run_jobsdb_spider(
+    job_category=None,
+    job_type=None,
+    sortmode="listed_date",
+    page=1,
+    concurrent_requests=32,
+    concurrent_requests_per_domain=16,
+    pages: Optional[Iterable[int]] = None,
+    raw: bool = False,
+):
+    """Run JobsDB spider and return the results as Job objects.
+
+    All requested pages are crawled by a single CrawlerProcess (see
+    ``iter_jobsdb_spider``), so Scrapy schedules the pages concurrently.
+
+    Args:
+        job_category: Category to search in (e.g., "software")
+        job_type: Type of job (default: None)
+        sortmode: Sorting method (default: "listed_date")
+        page: Page number, used when ``pages`` is not given (default: 1)
+        concurrent_requests: Scrapy CONCURRENT_REQUESTS (default: 32)
+        concurrent_requests_per_domain: Scrapy CONCURRENT_REQUESTS_PER_DOMAIN
+            (default: 16)
+        pages: Page numbers to crawl in one run (default: just ``page``)
+        raw: Return plain jobs-table row dicts instead of Job objects; these
+            can be passed straight to ``DatabaseConnector.save_jobs``
+
+    Returns:
+        List of Job objects (or row dicts when ``raw`` is set)
+    """
+    rows = list(
+        iter_jobsdb_spider(
+            job_category=job_category,
+            job_type=job_type,
+            sortmode=sortmode,
+            pages=pages if pages is not None else [page],
+            concurrent_requests=concurrent_requests,
+            concurrent_requests_per_domain=concurrent_requests_per_domain,
+        )
     )
+    return rows if raw else _validate_jobs(rows)
 
-    # Run the spider and wait for it to finish
-    process.start()
 
-    # Read the results from the temporary file
-    jobs = []
-    if os.path.exists(output_file):
-        with open(output_file, "r") as f:
-            items = json.load(f)
+# Jobs picked when neither IDs, a range nor --quantity are given
+DEFAULT_DETAIL_QUANTITY = 100
+# Number of scraped descriptions written per database transaction
+DESCRIPTION_FLUSH_SIZE = 50
+# Results waiting for the writer thread before the scrape loop blocks
+WRITE_QUEUE_SIZE = 1000
+# Max seconds a scraped description waits before being written
+DESCRIPTION_FLUSH_INTERVAL = 2.0
 
-        # Convert spider output to Job objects
-        for item in items:
-            # Ensure company is handled correctly
-            company_data = item.get("company", {})
-            company_name_str = (
-                company_data.get("name", "Unknown Company")
-                if isinstance(company_data, dict)
-                else str(company_data)
-            )
 
-            # Convert date string if it exists
-            date_scraped_obj = None
-            if item.get("date_scraped"):
-                try:
-                    date_scraped_obj = datetime.fromisoformat(item["date_scraped"])
-                except ValueError:
-                    logger.warning(
-                        f"Could not parse date_scraped: {item['date_scraped']}"
-                    )
-                    date_scraped_obj = datetime.utcnow()  # Fallback
-
-            job = Job(
-                id=item.get("id"),
-                name=item.get("title", "Unknown Title"),
-                description="",  # Empty description for search results
-                company_name=company_name_str,  # Use extracted string
-                location=item.get("location", "Unknown Location"),
-                source="Jobsdb",
-                date_scraped=date_scraped_obj,
-                # date_posted=item.get("date_posted"), # Uncomment if available
-                # work_type=item.get("work_type"), # Uncomment if available
-                salary_description=item.get("salary_description", "N/A"),
-                job_class=item.get("job_class", "N/A"),
-                # job_class_id=item.get("job_class_id"), # Uncomment if available
-                # job_subclass=item.get("job_subclass"), # Uncomment if available
-                # job_subclass_id=item.get("job_subclass_id"), # Uncomment if available
-                # other=item.get("other"), # Uncomment if available
-                # remark=item.get("remark") # Uncomment if available
-            )
-            # Validate essential fields before appending
-            if job.id and job.name:
-                jobs.append(job)
-            else:
-                logger.warning(f"Skipping job item due to missing ID or Title: {item}")
+# Detail results between progress log lines
+PROGRESS_LOG_EVERY = 50
+
+
+def _report_progress(
+    results_q: queue.Queue, total: int, cache: Optional[JobDetailCache], stats: dict
+) -> None:
+    """Progress thread: tally worker results until a None sentinel arrives.
+
+    Failed jobs are recorded in the detail cache (when one is given), and a
+    progress line is logged every PROGRESS_LOG_EVERY results and once at the
+    end.
 
-        # Clean up the temporary file
-        os.remove(output_file)
+    Args:
+        results_q: Queue of (job_id, success, description) tuples
+        total: Number of jobs being scraped
+        cache: Detail cache used to record failures, or None to not record them
+        stats: Dict whose "success"/"failure" counts are updated in place
+    """
+    processed = 0
+    while True:
+        result = results_q.get()
+        if result is None:
+            if processed != total:  # Stopped early; report how far it got
+                _log_progress(processed, total, stats)
+            return
 
-    return jobs
+        jid, ok, description = result
+        processed += 1
+        if ok:
+            stats["success"] += 1
+        else:
+            stats["failure"] += 1
+            if cache is not None and description is not None:
+                cache.mark_failed(jid, description)
+        if processed % PROGRESS_LOG_EVERY == 0 or processed == total:
+            _log_progress(processed, total, stats)
+
+
+def _log_progress(processed: int, total: int, stats: dict) -> None:
+    logger.info(
+        f"Progress: {processed}/{total} processed. Current Stats -> Success: {stats['success']}, Failure: {stats['failure']}"
+    )
 
 
 def scrape_job_details(
@@ -202,139 +693,252 @@ def scrape_job_details(
     end_id: Optional[int] = None,
     quantity: Optional[int] = None,
     save: bool = False,
-    max_workers: int = 5,
+    max_workers: Optional[int] = None,
+    force_rescrape: bool = False,
+    rps: float = DEFAULT_RPS,
+    concurrency: Optional[int] = None,
+    batch_size: int = DESCRIPTION_FLUSH_SIZE,
 ):
-    """Parallel scrape with ThreadPoolExecutor."""
-    db = DatabaseConnector()
-    # Determine job_ids if not provided
-    if not job_ids:
-        if start_id is not None and end_id is not None:
-            # Fetch IDs by internal_id range if start/end IDs are provided
-            job_ids = db.get_jobs_by_internal_id_range(start_id, end_id)
+    """Parallel scrape with ThreadPoolExecutor.
+
+    Descriptions already in the on-disk detail cache are reused unless
+    ``force_rescrape`` is set. When ``max_workers`` is None the worker count is
+    derived from the target server's measured latency. Detail requests from all
+    workers together are limited to ``rps`` per second. With ``concurrency``
+    set, pages are fetched over plain HTTP with aiohttp instead of through
+    Selenium worker threads. Previewing explicit ``job_ids`` (``save=False``)
+    does not connect to the database.
+    """
+    # Each run gets its own budget, so overlapping runs can't reset each other
+    rate_limiter = RateLimiter(rps)
+
+    # A preview of caller-supplied IDs needs no database at all
+    db = _get_db(pool_size=max_workers) if save or not job_ids else None
+    # Determine job_ids if not provided: one query covers the range, the
+    # missing-description filter and the limit
+    from_db = not job_ids
+    if from_db:
+        use_range = start_id is not None and end_id is not None
+        if not use_range and quantity is None:
+            quantity = DEFAULT_DETAIL_QUANTITY
+        job_ids = db.fetch_scrape_targets(
+            start_id,
+            end_id,
+            null_only=not force_rescrape,
+            limit=None if use_range else quantity,
+        )
+        if use_range:
             logger.info(
                 f"Found {len(job_ids)} job IDs in range {start_id}-{end_id} to scrape."
             )
-        elif quantity is not None:
-            # Fetch IDs with null description if quantity is provided
-            job_ids = db.get_jobs_with_null_description(limit=quantity)
-            logger.info(f"Found {len(job_ids)} jobs with null descriptions to scrape.")
         else:
-            # Default: fetch jobs with null descriptions (limit to a reasonable number if quantity not set)
-            default_quantity = 100  # Example default
-            job_ids = db.get_jobs_with_null_description(
-                limit=quantity if quantity is not None else default_quantity
-            )
             logger.info(
-                f"Found {len(job_ids)} jobs with null descriptions (default limit: {default_quantity if quantity is None else quantity})"
+                f"Found {len(job_ids)} jobs with null descriptions to scrape (limit: {quantity})."
             )
 
     if not job_ids:
         logger.warning("No job IDs found matching the criteria to scrape details for.")
         return
 
+    # Range merges and overlapping pages can repeat IDs; fetch each only once
+    deduped = list(dict.fromkeys(job_ids))
+    if len(deduped) != len(job_ids):
+        logger.info(f"Skipped {len(job_ids) - len(deduped)} duplicate job IDs.")
+    job_ids = deduped
+
+    # Caller-supplied IDs may already be populated; don't fetch those again
+    # (IDs from fetch_scrape_targets were already filtered by the query)
+    if not force_rescrape and not from_db and db is not None:
+        existing = db.get_existing_descriptions(job_ids)
+        if existing:
+            job_ids = [j for j in job_ids if not existing.get(str(j))]
+            logger.info(f"Skipping {len(existing)} jobs that already have descriptions.")
+        if not job_ids:
+            logger.info("All requested jobs already have descriptions.")
+            return
+
+    # Jobs that failed on a recent run are likely to fail again; skip them
+    cache = _get_detail_cache()
+    if not force_rescrape:
+        recent_failures = cache.recent_failures(job_ids)
+        if recent_failures:
+            job_ids = [j for j in job_ids if str(j) not in recent_failures]
+            logger.info(
+                f"Skipping {len(recent_failures)} jobs that failed within the last "
+                f"{cache.failure_ttl / 60:g} minutes."
+            )
+        if not job_ids:
+            logger.info("No jobs left to scrape.")
+            return
+
+    # Jobs already fetched by the latency probe are reported, not refetched
+    probed = []
+    if concurrency:
+        max_workers = concurrency
+    elif max_workers is None:
+        max_workers, probed = _probe_max_workers(job_ids, rate_limiter)
+        probed_ids = {jid for jid, _, _ in probed}
+        job_ids = [j for j in job_ids if j not in probed_ids]
+
+    total = len(job_ids) + len(probed)
     logger.info(
-        f"Starting detail scraping for {len(job_ids)} job IDs with {max_workers} workers (Save mode: {save})."
+        f"Starting detail scraping for {total} job IDs with {max_workers} "
+        f"{'concurrent requests' if concurrency else 'workers'} (Save mode: {save})."
     )
 
-    success = failure = 0
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Create futures mapping back to job IDs
-        futures = {executor.submit(_worker_scrape, jid, save): jid for jid in job_ids}
+    # A writer thread batches (job_id, description) pairs into the DB so
+    # scraping never waits on a flush; the bounded queue applies back-pressure
+    writer = None
+    if save:
+        writer = BatchWriter(
+            db.bulk_update_descriptions,
+            flush_threshold=batch_size,
+            flush_interval=DESCRIPTION_FLUSH_INTERVAL,
+            max_pending=WRITE_QUEUE_SIZE,
+        )
 
-        # Process completed futures
-        for fut in as_completed(futures):
-            jid = futures[fut]
-            processed_count = success + failure + 1  # Current job being processed
+    executor = None
+    if concurrency:
+        completed = _iter_completed_async(
+            job_ids, concurrency, rate_limiter, force_rescrape
+        )
+    else:
+        # Process completed futures, keeping a bounded number of jobs queued
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        completed = _iter_completed(
+            executor,
+            _worker_scrape,
+            job_ids,
+            max_workers * 2,
+            force_rescrape,
+            rate_limiter,
+        )
+    # Counting, failure bookkeeping and progress logging happen on their own
+    # thread so the result loop only hands results off
+    results_q: queue.Queue = queue.Queue(maxsize=max_workers * 2)
+    stats = {"success": 0, "failure": 0}
+    reporter = threading.Thread(
+        target=_report_progress,
+        # Preview runs don't record failures, so they can't hide jobs from
+        # the next saving run
+        args=(results_q, total, cache if save else None, stats),
+        name="detail-progress",
+        daemon=True,
+    )
+    reporter.start()
+    try:
+        for jid, ok, description in probed:
+            if writer and description is not None:
+                writer.submit((jid, description))
+            results_q.put((jid, ok, description))
+        for jid, fut in completed:
             try:
-                ok = fut.result()  # Get result (True/False) from worker future
-                if ok:
-                    success += 1
-                    # Optional: Log success less frequently to reduce noise
-                    # if success % 10 == 0:
-                    #    logger.debug(f"Job {jid} succeeded.")
-                else:
-                    failure += 1
-                    # Log failure clearly, indicating which job failed
-                    # logger.error(
-                    #     f"Progress: [{processed_count}/{len(job_ids)}] Job {jid} - Worker reported failure or no description found."
-                    # )
+                ok, description = fut.result()  # (success, description to store)
             except Exception as exc:
                 # Catch exceptions *propagated* from the worker (if not caught inside _worker_scrape)
-                failure += 1
                 logger.error(
-                    f"Progress: [{processed_count}/{len(job_ids)}] Job {jid} - Worker raised an unhandled exception: {exc}",
+                    f"Job {jid} - Worker raised an unhandled exception: {exc}",
                     exc_info=True,  # Include traceback for unexpected errors
                 )
+                ok, description = False, None
+            if writer and description is not None:
+                writer.submit((jid, description))
+            results_q.put((jid, ok, description))
+    finally:
+        if executor:
+            executor.shutdown()
+        _close_thread_scrapers()  # Quit the workers' browsers
+        results_q.put(None)  # Log the final progress line and stop
+        reporter.join()
+        if writer:
+            writer.close()  # Flush the last partial batch and stop
 
-            # Log overall progress periodically
-            if processed_count % 50 == 0 or processed_count == len(
-                job_ids
-            ):  # Log every 50 jobs or at the end
-                logger.info(
-                    f"Progress: {processed_count}/{len(job_ids)} processed. Current Stats -> Success: {success}, Failure: {failure}"
-                )
+    if writer and writer.submitted:
+        logger.info(
+            f"Saved {writer.written} of {writer.submitted} descriptions to database "
+            f"(descriptions already stored are not rewritten)."
+        )
 
+    success, failure = stats["success"], stats["failure"]
     logger.info(
         f"Scraping complete. Total processed: {success + failure}. Final Stats -> Success: {success}, Failure: {failure}"
     )
 
 
-def update_job_description(job_id: str, description: str = None):
+def _search_jobsdb_page(
+    page: int, job_category=None, job_type=None, sortmode="listed_date"
+) -> List[Job]:
+    """Search one JobsDB results page with the calling thread's scraper."""
+    logger.info(f"Scraping page {page}...")
+    return _get_thread_scraper().search_jobs(
+        job_category=job_category,
+        job_type=job_type,
+        sortmode=sortmode,
+        page=page,
+        # query=args.query # Pass query if needed by search_jobs
+        # location=args.location # Pass location if needed
+    )
+
+
+def update_job_description(
+    job_id: str,
+    description: str = None,
+    db: Optional[DatabaseConnector] = None,
+    scraper: Optional[JobsdbScraper] = None,
+):
     """Update job description for a specific job.
 
     Args:
         job_id: Job ID to update
         description: Optional description text. If None, will scrape it.
+        db: Connector to use (default: the shared module-level connector)
+        scraper: Scraper to use (default: the calling thread's shared scraper)
     """
-    # Initialize database connector and scraper
-    db = DatabaseConnector()
-    jobsdb_scraper = JobsdbScraper()
-    thread_id = threading.get_ident()  # Get current thread ID
-    log_prefix = f"[Thread-{thread_id} Job-{job_id}]"  # Create a log prefix for single updates too
+    # Reuse the shared connector so repeated calls don't reconnect
+    if db is None:
+        db = _get_db()
+    log = _job_logger(job_id)  # Same prefix as the detail workers' log lines
 
     try:
         # If description not provided, scrape it
         if description is None:
-            logger.info(f"{log_prefix} Scraping description")
-            # --- Add random delay ---
-            delay = random.uniform(1.0, 3.0)
-            logger.debug(f"{log_prefix} Sleeping for {delay:.2f} seconds")
-            time.sleep(delay)
-            # --- End delay ---
-            job_details = jobsdb_scraper.get_job_details(job_id)
+            log.info("Scraping description")
+            if scraper is None:
+                scraper = _get_thread_scraper()
+            with _rate_limiter:
+                job_details = scraper.get_job_details(job_id)
             if (
                 job_details
                 and job_details.description
                 and job_details.description != "N/A"
             ):
                 description = job_details.description
-                logger.debug(f"{log_prefix} Scraped description successfully.")
+                log.debug("Scraped description successfully.")
             elif job_details:  # Scraped but got N/A or empty
-                logger.warning(
-                    f"{log_prefix} Scraped empty/NA description, cannot update."
-                )
+                log.warning("Scraped empty/NA description, cannot update.")
                 return False
             else:  # Scraping failed
-                logger.error(f"{log_prefix} Could not scrape description.")
+                log.error("Could not scrape description.")
                 return False
 
         # Update the description in the database
-        logger.debug(f"{log_prefix} Attempting to save description to DB.")
+        log.debug("Attempting to save description to DB.")
         success = db.update_job_description(job_id, description)
         if success:
-            logger.info(f"{log_prefix} Successfully updated description.")
+            log.info("Successfully updated description.")
             return True
         else:
-            logger.error(f"{log_prefix} Failed to update description in DB.")
+            log.error("Failed to update description in DB.")
             return False
 
     except Exception as e:
-        logger.error(f"{log_prefix} Error updating job description: {e}", exc_info=True)
+        log.error(f"Error updating job description: {e}", exc_info=True)
         return False
 
 
-def main():
-    """Run the CLI application."""
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (once per process)."""
     parser = argparse.ArgumentParser(description="Job Scraper CLI")
 
     # --- Scraper Selection ---
@@ -350,6 +954,18 @@ def main():
         default="selenium",  # Or 'scrapy' if preferred
         help="Scraping method for searching jobs (default: selenium)",
     )
+    parser.add_argument(
+        "--concurrent_requests",
+        type=int,
+        default=32,
+        help="Scrapy CONCURRENT_REQUESTS for --method scrapy (default: 32)",
+    )
+    parser.add_argument(
+        "--concurrent_requests_per_domain",
+        type=int,
+        default=16,
+        help="Scrapy CONCURRENT_REQUESTS_PER_DOMAIN for --method scrapy (default: 16)",
+    )
 
     # --- Job Search Arguments ---
     search_group = parser.add_argument_group("Job Search Options (Scrapes listings)")
@@ -382,6 +998,18 @@ def main():
         default=1,  # Default to scraping only the start_page
         help="End page number for search results (inclusive, default: same as --start_page)",
     )
+    search_group.add_argument(
+        "--page_workers",
+        type=int,
+        default=1,
+        help="Pages searched in parallel with --method selenium, one browser each (default: 1)",
+    )
+    search_group.add_argument(
+        "--search_concurrency",
+        type=int,
+        default=None,
+        help="With --method selenium, fetch search pages over plain HTTP (aiohttp) with this many requests in flight, instead of browsers. Requests are limited by --rps.",
+    )
     search_group.add_argument(
         "--sortmode",
         choices=["listed_date", "relevance"],
@@ -438,8 +1066,31 @@ def main():
     details_group.add_argument(
         "--max_workers",
         type=int,
-        default=5,  # Keep default reasonable
-        help="Number of parallel workers for scraping details (default: 5).",
+        default=None,  # Probed from the server's latency when not given
+        help="Number of parallel workers for scraping details (default: auto, from SCRAPER_TARGET_RPS and probed latency).",
+    )
+    details_group.add_argument(
+        "--rps",
+        type=float,
+        default=DEFAULT_RPS,
+        help=f"Max detail requests per second across all workers (default: {DEFAULT_RPS:g}).",
+    )
+    details_group.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Fetch details over plain HTTP (aiohttp) with this many requests in flight, instead of Selenium workers.",
+    )
+    details_group.add_argument(
+        "--batch_size",
+        type=int,
+        default=DESCRIPTION_FLUSH_SIZE,
+        help=f"Descriptions written per database transaction with --save (default: {DESCRIPTION_FLUSH_SIZE}).",
+    )
+    details_group.add_argument(
+        "--force_rescrape",
+        action="store_true",
+        help="Ignore the on-disk detail cache and fetch every job page again.",
     )
 
     # --- Direct Update Argument ---
@@ -451,145 +1102,281 @@ def main():
         help="Scrape and update description for a single specific job ID.",
     )
 
+    # --- Maintenance Arguments ---
+    maintenance_group = parser.add_argument_group("Maintenance Options")
+    maintenance_group.add_argument(
+        "--create_indexes",
+        action="store_true",
+        help="Build missing jobs-table indexes with CREATE INDEX CONCURRENTLY, then exit.",
+    )
+
     # --- General Arguments ---
     parser.add_argument(
         "--save", action="store_true", help="Save scraped jobs/details to database."
     )
+    parser.add_argument(
+        "--bulk_copy",
+        action="store_true",
+        help="With --search --save, load jobs using COPY FROM STDIN (fastest for many pages).",
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable debug logging."
     )
+    parser.add_argument(
+        "--log_level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default=None,
+        help="Log level (default: INFO, or DEBUG with --verbose). Per-job messages are logged at DEBUG.",
+    )
 
-    args = parser.parse_args()
+    return parser
 
-    # Adjust log level if verbose
-    if args.verbose:
-        # Set root logger level
-        logging.getLogger().setLevel(logging.DEBUG)
-        # Set level for specific loggers if needed (e.g., suppress noisy libraries)
-        logging.getLogger("WDM").setLevel(logging.INFO)  # Or WARNING
-        logging.getLogger("urllib3").setLevel(logging.INFO)  # Often noisy
-        logger.debug("Verbose logging enabled.")
-    else:
-        # Ensure default level is INFO if not verbose
-        logging.getLogger().setLevel(logging.INFO)
-        logging.getLogger("WDM").setLevel(logging.WARNING)
-        logging.getLogger("urllib3").setLevel(logging.WARNING)
 
-    # Determine action based on arguments
-    action_taken = False
-
-    # --- Action: Update Single Description ---
+def _select_command(args: argparse.Namespace) -> Optional[str]:
+    """Pick the CLI action to run; the first matching flag wins."""
+    if args.create_indexes:
+        return "create_indexes"
     if args.update_description:
-        logger.info(
-            f"Attempting to update description for job ID: {args.update_description}"
-        )
-        # Force save=True for single update is implied
-        update_job_description(args.update_description)
-        action_taken = True
-
-    # --- Action: Scrape Details ---
+        return "update_description"
     # Prioritize range over quantity if both flags are somehow set
-    elif (
+    if (
         args.scrape_details_range
         and args.start_id is not None
         and args.end_id is not None
     ):
-        logger.info(
-            f"Starting detail scraping for internal ID range: {args.start_id} - {args.end_id}"
-        )
-        scrape_job_details(
-            start_id=args.start_id,
-            end_id=args.end_id,
-            save=args.save,
-            max_workers=args.max_workers,
-        )
-        action_taken = True
-    elif args.details:
-        logger.info(
-            f"Starting detail scraping for up to {args.quantity} jobs missing descriptions."
-        )
-        scrape_job_details(
-            quantity=args.quantity, save=args.save, max_workers=args.max_workers
-        )
-        action_taken = True
-
-    # --- Action: Search for Job Listings ---
-    elif args.search:
-        logger.info(f"Starting job search on {args.source} using {args.method} method.")
-        db = None  # Initialize db only if saving
-        if args.save:
-            db = DatabaseConnector()
-
-        if args.source == "all" or args.source == "jobsdb":
-            # Set end_page to start_page if end_page is less than start_page or None
-            if args.end_page is None or args.end_page < args.start_page:
-                args.end_page = args.start_page
-            total_jobs_found_all_pages = 0
-
-            # Loop through pages from start to end
-            for current_page in range(args.start_page, args.end_page + 1):
-                logger.info(f"Scraping page {current_page} of {args.end_page}...")
-                jobs_on_page = []
-
-                try:
-                    if args.method == "scrapy":
-                        # Use Scrapy spider
-                        jobs_on_page = run_jobsdb_spider(
-                            job_category=args.job_category,
-                            job_type=args.job_type,
-                            sortmode=args.sortmode,
-                            page=current_page,
-                        )
-                    else:  # Default to selenium
-                        # Use Selenium-based scraper
-                        # Need to ensure JobsdbScraper is instantiated correctly
-                        jobsdb_scraper = (
-                            JobsdbScraper()
-                        )  # Instantiate here or make it global? Careful with state.
-                        jobs_on_page = jobsdb_scraper.search_jobs(
-                            job_category=args.job_category,
-                            job_type=args.job_type,
-                            sortmode=args.sortmode,
-                            page=current_page,
-                            # query=args.query # Pass query if needed by search_jobs
-                            # location=args.location # Pass location if needed
-                        )
-                    logger.info(
-                        f"Found {len(jobs_on_page)} jobs on Jobsdb (page {current_page})"
-                    )
-                    total_jobs_found_all_pages += len(jobs_on_page)
+        return "details_range"
+    if args.details:
+        return "details"
+    if args.search:
+        return "search"
+    return None
 
-                    # Save to database if enabled
-                    if args.save and db and jobs_on_page:
-                        logger.info(
-                            f"Saving {len(jobs_on_page)} jobs from page {current_page}..."
-                        )
-                        saved_count = db.save_jobs(
-                            jobs_on_page
-                        )  # Assuming save_jobs handles duplicates/updates
-                        logger.info(
-                            f"Attempted to save {len(jobs_on_page)} jobs. Result count (may differ due to updates/skips): {saved_count}."
-                        )
 
-                except Exception as e:
-                    logger.error(
-                        f"Error scraping page {current_page}: {e}",
-                        exc_info=args.verbose,
-                    )  # Show traceback if verbose
-                    # Decide whether to continue to next page or stop
-                    # break # Example: stop on error
+def _detail_options(args: argparse.Namespace) -> dict:
+    """scrape_job_details keyword arguments shared by both detail commands."""
+    return dict(
+        save=args.save,
+        max_workers=args.max_workers,
+        force_rescrape=args.force_rescrape,
+        rps=args.rps,
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+    )
+
+
+# --- Action: Create Indexes ---
+def _cmd_create_indexes(args: argparse.Namespace) -> None:
+    logger.info("Creating missing jobs-table indexes (CONCURRENTLY).")
+    DatabaseConnector().create_indexes()
+
+
+# --- Action: Update Single Description ---
+def _cmd_update_description(args: argparse.Namespace) -> None:
+    logger.info(
+        f"Attempting to update description for job ID: {args.update_description}"
+    )
+    # Force save=True for single update is implied
+    update_job_description(args.update_description)
+
+
+# --- Action: Scrape Details ---
+def _cmd_details_range(args: argparse.Namespace) -> None:
+    logger.info(
+        f"Starting detail scraping for internal ID range: {args.start_id} - {args.end_id}"
+    )
+    scrape_job_details(
+        start_id=args.start_id, end_id=args.end_id, **_detail_options(args)
+    )
+
+
+def _cmd_details(args: argparse.Namespace) -> None:
+    logger.info(
+        f"Starting detail scraping for up to {args.quantity} jobs missing descriptions."
+    )
+    scrape_job_details(quantity=args.quantity, **_detail_options(args))
+
+
+# Rows per save_jobs call while a Scrapy crawl is streaming results
+SEARCH_SAVE_BATCH_SIZE = 1000
+
+
+# --- Action: Search for Job Listings ---
+def _cmd_search(args: argparse.Namespace) -> None:
+    logger.info(f"Starting job search on {args.source} using {args.method} method.")
+    db = None  # Initialize db only if saving
+    if args.save:
+        db = DatabaseConnector()
+        # COPY for large multi-page loads, batched INSERTs otherwise
+        save_jobs = db.copy_jobs if args.bulk_copy else db.save_jobs
+
+    if args.source == "all" or args.source == "jobsdb":
+        # Set end_page to start_page if end_page is less than start_page or None
+        if args.end_page is None or args.end_page < args.start_page:
+            args.end_page = args.start_page
+        total_jobs_found_all_pages = 0
+
+        # Scrapy crawls every page in one child-process run; rows are saved
+        # in batches while the crawl is still producing them
+        if args.method == "scrapy":
+            saved_count = 0
+            batch = []
+            try:
+                for row in iter_jobsdb_spider(
+                    job_category=args.job_category,
+                    job_type=args.job_type,
+                    sortmode=args.sortmode,
+                    pages=range(args.start_page, args.end_page + 1),
+                    concurrent_requests=args.concurrent_requests,
+                    concurrent_requests_per_domain=args.concurrent_requests_per_domain,
+                ):
+                    total_jobs_found_all_pages += 1
+                    if args.save and db:
+                        batch.append(row)
+                        if len(batch) >= SEARCH_SAVE_BATCH_SIZE:
+                            # Detach the batch first so a failed save isn't
+                            # retried by the final flush below
+                            pending, batch = batch, []
+                            saved_count += save_jobs(pending)
+            except Exception as e:
+                logger.error(
+                    f"Error scraping pages {args.start_page}-{args.end_page}: {e}",
+                    exc_info=args.verbose,
+                )
+            finally:
+                # Save to database if enabled (whatever was scraped)
+                if batch:
+                    try:
+                        saved_count += save_jobs(batch)
+                    except Exception as e:
+                        logger.error(
+                            f"Error saving the last {len(batch)} jobs: {e}",
+                            exc_info=args.verbose,
+                        )
 
             logger.info(
-                f"Total jobs found across pages {args.start_page} to {args.end_page}: {total_jobs_found_all_pages}"
+                f"Found {total_jobs_found_all_pages} jobs on Jobsdb (pages {args.start_page}-{args.end_page})"
             )
-        action_taken = True
+            if args.save and db:
+                logger.info(
+                    f"Attempted to save {total_jobs_found_all_pages} jobs. Result count (may differ due to updates/skips): {saved_count}."
+                )
+        elif args.search_concurrency:
+            # Plain HTTP: every page is fetched on one event loop, no browser
+            from .scrapers.jobsdb import JobsdbScraper
+
+            all_jobs = []
+            loop = _new_event_loop()
+            try:
+                all_jobs = loop.run_until_complete(
+                    JobsdbScraper(use_driver=False).search_jobs_async(
+                        range(args.start_page, args.end_page + 1),
+                        RateLimiter(args.rps),
+                        concurrency=args.search_concurrency,
+                        job_category=args.job_category,
+                        job_type=args.job_type,
+                        sortmode=args.sortmode,
+                    )
+                )
+                loop.run_until_complete(loop.shutdown_default_executor())
+            except Exception as e:
+                logger.error(
+                    f"Error scraping pages {args.start_page}-{args.end_page}: {e}",
+                    exc_info=args.verbose,
+                )
+            finally:
+                loop.close()
+            total_jobs_found_all_pages = len(all_jobs)
+
+            if args.save and db and all_jobs:
+                saved_count = save_jobs(all_jobs)
+                logger.info(
+                    f"Attempted to save {len(all_jobs)} jobs. Result count (may differ due to updates/skips): {saved_count}."
+                )
+        else:
+            # Selenium: pages are independent, so search them on a small
+            # thread pool; each thread reuses its own browser session
+            all_jobs = []
+            try:
+                with ThreadPoolExecutor(max_workers=args.page_workers) as executor:
+                    for current_page, fut in _iter_completed(
+                        executor,
+                        _search_jobsdb_page,
+                        range(args.start_page, args.end_page + 1),
+                        args.page_workers,
+                        args.job_category,
+                        args.job_type,
+                        args.sortmode,
+                    ):
+                        try:
+                            jobs_on_page = fut.result()
+                            logger.info(
+                                f"Found {len(jobs_on_page)} jobs on Jobsdb (page {current_page})"
+                            )
+                            total_jobs_found_all_pages += len(jobs_on_page)
+                            all_jobs.extend(jobs_on_page)
+
+                        except Exception as e:
+                            logger.error(
+                                f"Error scraping page {current_page}: {e}",
+                                exc_info=args.verbose,
+                            )  # Show traceback if verbose
+            finally:
+                _close_thread_scrapers()  # Quit the page browsers
+
+            # Save every page in one bulk insert if enabled
+            if args.save and db and all_jobs:
+                saved_count = save_jobs(all_jobs)
+                logger.info(
+                    f"Attempted to save {len(all_jobs)} jobs. Result count (may differ due to updates/skips): {saved_count}."
+                )
+
+        logger.info(
+            f"Total jobs found across pages {args.start_page} to {args.end_page}: {total_jobs_found_all_pages}"
+        )
 
-    # --- No Action ---
-    if not action_taken:
+
+_COMMANDS = {
+    "create_indexes": _cmd_create_indexes,
+    "update_description": _cmd_update_description,
+    "details_range": _cmd_details_range,
+    "details": _cmd_details,
+    "search": _cmd_search,
+}
+
+
+def main():
+    """Run the CLI application."""
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    # Adjust log level if verbose (an explicit --log_level wins)
+    if args.log_level:
+        logging.getLogger().setLevel(args.log_level)
+        noisy_level = logging.INFO if args.log_level == "DEBUG" else logging.WARNING
+        logging.getLogger("WDM").setLevel(noisy_level)
+        logging.getLogger("urllib3").setLevel(noisy_level)
+    elif args.verbose:
+        # Set root logger level
+        logging.getLogger().setLevel(logging.DEBUG)
+        # Set level for specific loggers if needed (e.g., suppress noisy libraries)
+        logging.getLogger("WDM").setLevel(logging.INFO)  # Or WARNING
+        logging.getLogger("urllib3").setLevel(logging.INFO)  # Often noisy
+        logger.debug("Verbose logging enabled.")
+    else:
+        # Ensure default level is INFO if not verbose
+        logging.getLogger().setLevel(logging.INFO)
+        logging.getLogger("WDM").setLevel(logging.WARNING)
+        logging.getLogger("urllib3").setLevel(logging.WARNING)
+
+    # Determine action based on arguments and run its handler
+    command = _select_command(args)
+    if command is None:
         logger.warning(
-            "No action specified. Use --search, --details, --scrape_details_range, or --update_description."
+            "No action specified. Use --search, --details, --scrape_details_range, --update_description, or --create_indexes."
         )
         parser.print_help()
+        return
+    _COMMANDS[command](args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,93 @@
+"""Background writer that groups many small DB writes into batched flushes."""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, List
+
+logger = logging.getLogger(__name__)
+
+
+class BatchWriter:
+    """Collect submitted rows on a background thread and flush them in batches.
+
+    A flush happens once ``flush_threshold`` rows are waiting or
+    ``flush_interval`` seconds after the first waiting row arrived, whichever
+    comes first, so rows are not held back when results trickle in slowly.
+    The bounded queue blocks ``submit`` when the database falls behind.
+    """
+
+    def __init__(
+        self,
+        flush_fn: Callable[[List[Any]], int],
+        flush_threshold: int = 100,
+        flush_interval: float = 2.0,
+        max_pending: int = 1000,
+    ):
+        """Start the writer thread.
+
+        Args:
+            flush_fn: Writes one batch and returns the number of rows written
+            flush_threshold: Rows per flush
+            flush_interval: Max seconds a row waits before being flushed
+            max_pending: Rows queued before ``submit`` blocks
+        """
+        self.flush_fn = flush_fn
+        self.flush_threshold = flush_threshold
+        self.flush_interval = flush_interval
+        self.submitted = 0
+        self.written = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._closed = object()  # Sentinel telling the thread to stop
+        self._thread = threading.Thread(
+            target=self._run, name="batch-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, row: Any) -> None:
+        """Queue one row for the next flush (blocks if the queue is full)."""
+        self._queue.put(row)
+
+    def close(self) -> None:
+        """Flush everything still queued and stop the writer thread."""
+        self._queue.put(self._closed)
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def _run(self) -> None:
+        batch = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                row = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                row = None  # Interval elapsed with a partial batch waiting
+
+            closing = row is self._closed
+            if row is not None and not closing:
+                batch.append(row)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+
+            due = deadline is not None and time.monotonic() >= deadline
+            if batch and (closing or due or len(batch) >= self.flush_threshold):
+                self._flush(batch)
+                batch = []
+                deadline = None
+            if closing:
+                return
+
+    def _flush(self, batch: List[Any]) -> None:
+        self.submitted += len(batch)
+        try:
+            self.written += self.flush_fn(batch)
+        except Exception as e:
+            logger.error(f"Error flushing {len(batch)} rows: {e}", exc_info=True)
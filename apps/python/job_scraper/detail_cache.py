@@ -0,0 +1,98 @@
+"""Persistent on-disk cache of scraped job descriptions."""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Stored next to the package, like the scrapers' raw_data/cookies folders
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "cache", "job_details.sqlite3"
+)
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+# Failed scrapes are not retried within this window
+DEFAULT_FAILURE_TTL_SECONDS = 60 * 60
+
+
+class JobDetailCache:
+    """SQLite-backed cache mapping job IDs to their scraped descriptions.
+
+    A single connection is shared by all worker threads and guarded by a lock.
+    Only valid descriptions are stored. Failed scrapes are recorded separately
+    so that repeated runs skip them until ``failure_ttl`` has passed.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_CACHE_PATH,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        failure_ttl: float = DEFAULT_FAILURE_TTL_SECONDS,
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            path: Location of the SQLite file
+            ttl: Seconds after which a cached description is considered stale
+            failure_ttl: Seconds during which a failed job is not retried
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS job_detail_cache ("
+            "job_id TEXT PRIMARY KEY, description TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS job_detail_failures ("
+            "job_id TEXT PRIMARY KEY, status TEXT NOT NULL, failed_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        logger.debug(f"Job detail cache opened at {path}")
+
+    def get(self, job_id) -> Optional[str]:
+        """Return the cached description for a job, or None if missing/stale."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT description FROM job_detail_cache WHERE job_id = ? AND fetched_at >= ?",
+                (str(job_id), time.time() - self.ttl),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, job_id, description: str) -> None:
+        """Store (or refresh) the description scraped for a job."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO job_detail_cache (job_id, description, fetched_at) VALUES (?, ?, ?)",
+                (str(job_id), description, time.time()),
+            )
+            self._conn.commit()
+
+    def mark_failed(self, job_id, status: str) -> None:
+        """Record a failed scrape so it is skipped until failure_ttl passes."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO job_detail_failures (job_id, status, failed_at) VALUES (?, ?, ?)",
+                (str(job_id), status, time.time()),
+            )
+            self._conn.commit()
+
+    def recent_failures(self, job_ids: Iterable) -> Set[str]:
+        """Return the IDs among ``job_ids`` that failed within failure_ttl."""
+        cutoff = time.time() - self.failure_ttl
+        with self._lock:
+            # Drop expired entries so the table only holds the current window
+            self._conn.execute(
+                "DELETE FROM job_detail_failures WHERE failed_at < ?", (cutoff,)
+            )
+            self._conn.commit()
+            failed = {
+                row[0]
+                for row in self._conn.execute("SELECT job_id FROM job_detail_failures")
+            }
+        return failed.intersection(str(job_id) for job_id in job_ids)
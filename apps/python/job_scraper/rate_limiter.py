@@ -0,0 +1,50 @@
+"""Thread-safe token bucket for capping request rates across workers."""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Token bucket allowing ``rate`` acquisitions per second on average.
+
+    Up to ``burst`` tokens can accumulate while idle. Use as a context manager
+    (``with limiter:``) or call :meth:`acquire` directly; both block until a
+    token is available.
+    """
+
+    def __init__(self, rate: float, burst: float = None):
+        """Create a full bucket.
+
+        Args:
+            rate: Tokens added per second (the sustained requests/second)
+            burst: Bucket capacity (default: ``rate``, at least 1)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = max(1.0, burst if burst is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until the bucket has refilled enough."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
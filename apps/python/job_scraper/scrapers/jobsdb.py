@@ -3,18 +3,20 @@
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 import re
 import random  # Import random
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
 
 from ..base.scraper import BaseScraper
 from ..models.job import Company, Job
+from ..rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
-# List of common User-Agent strings
-USER_AGENTS = [
+# Common User-Agent strings (a tuple: read-only, indexed per request)
+USER_AGENTS = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/109.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36",
@@ -22,15 +24,213 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/108.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 13_1) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.1 Safari/605.1.15",
-]
+)
+
+JOB_DETAILS_URL = "https://hk.jobsdb.com/job/{job_id}"
+
+# Search pages are parsed with lxml's C parser when it is installed (detail
+# pages keep BaseScraper's html.parser)
+try:
+    import lxml  # noqa: F401
+
+    SEARCH_HTML_PARSER = "lxml"
+except ImportError:
+    SEARCH_HTML_PARSER = "html.parser"
+
+# Search pages are parsed into job-card elements only; headers, scripts and
+# sidebars are skipped instead of being built into the tree
+JOB_CARD_STRAINER = SoupStrainer("article", attrs={"data-job-id": True})
+ALT_JOB_CARD_STRAINER = SoupStrainer("div", attrs={"data-jobid": True})
+
+# Default number of search pages search_jobs_async keeps in flight
+SEARCH_CONCURRENCY = 20
+
+# CSS selectors compiled once at import instead of on every select() call
+_JOB_CARD_SELECTOR = sv.compile("article[data-job-id]")
+_ALT_JOB_CARD_SELECTOR = sv.compile("div[data-jobid]")
+
+# Last-resort job ID lookup in JSON embedded in a card
+_JOB_ID_RE = re.compile(r'"jobId":"?(\d+)"?')
+
+# Companies, locations and listing dates repeat across cards and pages; equal
+# strings share one object up to this many distinct values
+INTERN_MAX_SIZE = 10000
+_interned: Dict[str, str] = {}
+
+
+def _intern(value: str) -> str:
+    """Return the shared copy of a repeated card string."""
+    shared = _interned.get(value)
+    if shared is not None:
+        return shared
+    if len(_interned) < INTERN_MAX_SIZE:
+        _interned[value] = value
+    return value
+
+
+def _find_embedded_job_id(card) -> Optional[str]:
+    """Find a ``"jobId":"<digits>"`` value in a card's text or attributes.
+
+    Searches the card's strings and attribute values in place instead of
+    serializing the whole card back to HTML.
+
+    Args:
+        card: Job card element
+
+    Returns:
+        The job ID, or None if the card doesn't embed one
+    """
+    text = card.find(string=_JOB_ID_RE)
+    if text is not None:
+        return _JOB_ID_RE.search(text).group(1)
+    for element in [card, *card.find_all(True)]:
+        for value in element.attrs.values():
+            if isinstance(value, str) and "jobId" in value:
+                match = _JOB_ID_RE.search(value)
+                if match:
+                    return match.group(1)
+    return None
+
+
+def _automation_elements(card) -> Dict[Tuple[str, str], BeautifulSoup]:
+    """Index a card's data-automation elements in one pass over its subtree.
+
+    Args:
+        card: Job card element
+
+    Returns:
+        Dict mapping (tag name, data-automation value) to the first such
+        element. The title lookups _parse_job_card prefers are indexed too:
+        ("h3 a", "jobTitle") is the first jobTitle link inside an h3, and
+        ("div a", "jobTitle") the first link inside a jobTitle div.
+    """
+    elements = {}
+    for element in card.find_all(attrs={"data-automation": True}):
+        automation = element["data-automation"]
+        elements.setdefault((element.name, automation), element)
+        if automation == "jobTitle":
+            if element.name == "a" and element.find_parent("h3") is not None:
+                elements.setdefault(("h3 a", automation), element)
+            elif element.name == "div":
+                link = element.find("a")
+                if link is not None:
+                    elements.setdefault(("div a", automation), link)
+    return elements
+
+
+def parse_job_description(soup: BeautifulSoup, job_id: Optional[str] = None) -> str:
+    """Extract the cleaned description text from a job details page.
+
+    Args:
+        soup: Parsed job details page
+        job_id: JobsDB job ID, used in log messages
+
+    Returns:
+        Description with whitespace normalised, or "N/A" if none was found.
+    """
+    # Extract job description (Selector needs verification)
+    # Common selectors: div[class*="description"], div[id*="description"], section[class*="content"]
+    description_element = soup.select_one(
+        'div[data-automation="jobAdDetails"] ._1apz9us0'
+    )  # Example selector, needs verification
+    if not description_element:
+        # Try alternative selectors
+        description_element = soup.select_one("div.job-description")
+    if not description_element:
+        logger.debug(
+            f"Could not find description element for job ID: {job_id}. Check selectors."
+        )
+        return "N/A"  # Fallback if no description found
+
+    # Get text, preserve line breaks somewhat
+    description = description_element.get_text(separator="\\n", strip=True)
+    # Basic cleaning (same as BaseScraper.clean_text)
+    return " ".join(description.split()) if description else "N/A"
+
+
+async def fetch_job_details(session, job_id: str) -> Optional[Job]:
+    """Fetch a job's description over plain HTTP, without a browser.
+
+    Args:
+        session: Open aiohttp.ClientSession
+        job_id: JobsDB job ID
+
+    Returns:
+        Job object with ID and description, or None if the request fails.
+    """
+    headers = {"User-Agent": random.choice(USER_AGENTS)}
+    try:
+        async with session.get(
+            JOB_DETAILS_URL.format(job_id=job_id), headers=headers
+        ) as response:
+            if response.status != 200:
+                logger.warning(f"Job {job_id}: HTTP {response.status}")
+                return None
+            html = await response.text()
+    except Exception as e:
+        logger.debug(f"Job {job_id}: request failed: {e}")
+        return None
+
+    soup = BeautifulSoup(html, "html.parser")
+    return Job(id=str(job_id), description=parse_job_description(soup, job_id))
+
+
+async def fetch_search_page(
+    session, url: str, params: Dict, user_agent: str
+) -> Optional[str]:
+    """Fetch one search results page over plain HTTP, without a browser.
+
+    Args:
+        session: Open aiohttp.ClientSession
+        url: Search URL
+        params: Query parameters (sortmode, page)
+        user_agent: User-Agent header to send
+
+    Returns:
+        Page HTML, or None if the request fails.
+    """
+    headers = {"User-Agent": user_agent}
+    try:
+        async with session.get(url, params=params, headers=headers) as response:
+            if response.status != 200:
+                logger.warning(f"{url} page {params.get('page')}: HTTP {response.status}")
+                return None
+            return await response.text()
+    except Exception as e:
+        logger.warning(f"{url} page {params.get('page')}: request failed: {e}")
+        return None
 
 
 class JobsdbScraper(BaseScraper):
     """Scraper for Jobsdb job listings."""
 
-    def __init__(self):
-        """Initialize the Jobsdb scraper."""
-        super().__init__(name="Jobsdb", base_url="https://hk.jobsdb.com/")
+    # Available job types
+    _JOB_TYPES = {
+        "full_time": "full-time",
+        "part_time": "part-time",
+        "contract": "contract-temp",
+        "casual": "casual-vacation",
+    }
+
+    # Available categories
+    _JOB_CATEGORIES = {
+        "software": "information-communication-technology",
+        "finance": "accounting-finance",
+        # Add more categories as needed
+    }
+
+    # Available sort modes
+    _SORTMODES = {"listed_date": "ListedDate", "relevance": "KeywordRelevance"}
+
+    def __init__(self, use_driver: bool = True):
+        """Initialize the Jobsdb scraper.
+
+        Args:
+            use_driver: Start a browser (not needed for search_jobs_async)
+        """
+        super().__init__(
+            name="Jobsdb", base_url="https://hk.jobsdb.com/", use_driver=use_driver
+        )
         # Example URL: "https://hk.jobsdb.com/jobs-in-information-communication-technology?sortmode=ListedDate&page=1"
 
     def search_filters(
@@ -46,23 +246,9 @@ class JobsdbScraper(BaseScraper):
         Returns:
             Tuple of (category_path, job_type_path, sortmode_value)
         """
-        # Available job types
-        job_types = {
-            "full_time": "full-time",
-            "part_time": "part-time",
-            "contract": "contract-temp",
-            "casual": "casual-vacation",
-        }
-
-        # Available categories
-        job_categories = {
-            "software": "information-communication-technology",
-            "finance": "accounting-finance",
-            # Add more categories as needed
-        }
-
-        # Available sort modes
-        sortmodes = {"listed_date": "ListedDate", "relevance": "KeywordRelevance"}
+        job_types = self._JOB_TYPES
+        job_categories = self._JOB_CATEGORIES
+        sortmodes = self._SORTMODES
 
         # Default values
         default_category_path = (
@@ -107,14 +293,103 @@ class JobsdbScraper(BaseScraper):
         Returns:
             List of Job objects found on the page.
         """
-        job_category = kwargs.get("job_category")
-        sortmode = kwargs.get("sortmode", "listed_date")
-        job_type = kwargs.get("job_type")
         page = kwargs.get("page", 1)
         # Potentially use query/location if the URL structure supports it or if using Selenium actions
+        search_url, params = self._search_request(**kwargs)
+
+        # --- Select random User-Agent ---
+        headers = {"User-Agent": random.choice(USER_AGENTS)}
+        # logger.info(
+        #     f"Searching jobs on page {page} with User-Agent: {headers['User-Agent']}"
+        # )
+
+        try:
+            # logger.info(f"Fetching URL: {search_url} with params: {params} and headers: {headers}")
+            html = self.get_page_source(search_url, params=params
+                                        #, headers=headers
+                                        )
+            if not html:
+                logger.error(f"Failed to get page source for {search_url} page {page}")
+                return []
+
+            return self.parse_search_page(html, **kwargs)
+
+        except Exception as e:
+            logger.error(
+                f"Error searching jobs on JobsDB page {page}: {e}", exc_info=True
+            )
+            return []
+
+    async def search_jobs_async(
+        self,
+        pages: Iterable[int],
+        rate_limiter: RateLimiter,
+        concurrency: int = SEARCH_CONCURRENCY,
+        **kwargs,
+    ) -> List[Job]:
+        """Fetch several search result pages concurrently over plain HTTP.
+
+        Unlike search_jobs, no browser is involved: pages are requested through
+        one pooled aiohttp session, at most ``concurrency`` at a time and each
+        after taking a token from ``rate_limiter``. Once every page has been
+        fetched, the pages are parsed. Pages that fail are logged and skipped.
+
+        Args:
+            pages: Page numbers to fetch
+            rate_limiter: Limiter every page request takes a token from
+            concurrency: Maximum number of simultaneous requests
+            **kwargs: Same search parameters as search_jobs, without ``page``
+
+        Returns:
+            Job objects from all pages, in page order.
+        """
+        import asyncio
+
+        import aiohttp
+
+        kwargs.pop("page", None)
+        pages = list(pages)
+        # One User-Agent per page, drawn in a single call
+        user_agents = random.choices(USER_AGENTS, k=len(pages))
+
+        async def fetch_page(session, semaphore, page, user_agent):
+            async with semaphore:
+                # The limiter blocks, so wait for a token off the event loop
+                await asyncio.to_thread(rate_limiter.acquire)
+                return await fetch_search_page(
+                    session, *self._search_request(page=page, **kwargs), user_agent
+                )
+
+        semaphore = asyncio.Semaphore(concurrency)
+        connector = aiohttp.TCPConnector(limit=concurrency, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            pages_html = await asyncio.gather(
+                *(
+                    fetch_page(session, semaphore, page, user_agent)
+                    for page, user_agent in zip(pages, user_agents)
+                )
+            )
+
+        job_listings = []
+        for page, html in zip(pages, pages_html):
+            if html:
+                job_listings.extend(self.parse_search_page(html, page=page, **kwargs))
+        return job_listings
+
+    def _search_request(self, **kwargs) -> Tuple[str, Dict]:
+        """Build the search URL and query parameters for one results page.
+
+        Args:
+            **kwargs: Search parameters, as for search_jobs
 
+        Returns:
+            Tuple of (search_url, params)
+        """
         category_path, job_type_path, sortmode_value = self.search_filters(
-            job_category, sortmode, job_type
+            kwargs.get("job_category"),
+            kwargs.get("sortmode", "listed_date"),
+            kwargs.get("job_type"),
         )
 
         # Build the URL
@@ -125,80 +400,74 @@ class JobsdbScraper(BaseScraper):
             # Example: /jobs-in-cat?sortmode=X&page=Y
             search_url = f"{self.base_url}jobs-in-{category_path}"
 
-        params = {"sortmode": sortmode_value, "page": page}
+        params = {"sortmode": sortmode_value, "page": kwargs.get("page", 1)}
         # Add query/location to params if the site uses them like ?q=...&l=...
         # if kwargs.get("query"): params["q"] = kwargs["query"]
         # if kwargs.get("location"): params["l"] = kwargs["location"]
+        return search_url, params
 
-        # --- Select random User-Agent ---
-        headers = {"User-Agent": random.choice(USER_AGENTS)}
-        # logger.info(
-        #     f"Searching jobs on page {page} with User-Agent: {headers['User-Agent']}"
-        # )
+    def parse_search_page(self, html: str, **kwargs) -> List[Job]:
+        """Extract the job cards from a search results page.
 
-        try:
-            # Assumes get_soup accepts headers and params
-            # logger.info(f"Fetching URL: {search_url} with params: {params} and headers: {headers}")
-            soup = self.get_soup(search_url, params=params
-                                 #, headers=headers
-                                 )
-            if not soup:
-                logger.error(
-                    f"Failed to get soup object for page {page} of {category_path}"
-                )
-                return []
+        Args:
+            html: Page source of a search results page
+            **kwargs: Search parameters the page was fetched with, as for
+                search_jobs (used to tag jobs and in log messages)
 
-            job_listings = []
-            # Find job cards (Selector needs verification against actual JobsDB HTML)
-            # Common patterns: article, div with data-job-id, li elements
-            job_cards = soup.select("article[data-job-id]")
-            if not job_cards:
-                # Try alternative selectors if the primary one fails
-                job_cards = soup.select("div[data-jobid]")  # Example alternative
-                if not job_cards:
-                    logger.warning(
-                        f"Could not find job cards on page {page} using selectors. Check HTML structure."
-                    )
-                    # Maybe log soup.prettify() here for debugging if needed (careful with size)
-
-            # logger.info(f"Found {len(job_cards)} potential job cards on page {page}.")
-
-            for card in job_cards:
-                try:
-                    job = self._parse_job_card(card, job_category, job_type)
-                    if job:
-                        # Basic validation before adding
-                        if job.id and job.name and job.company_name:
-                            job_listings.append(job)
-                        else:
-                            logger.warning(
-                                f"Parsed job card missing essential info (ID/Name/Company): {job.id}, {job.name}"
-                            )
-                except Exception as e:
-                    # Log error for specific card parsing failure but continue with others
-                    logger.error(
-                        f"Error parsing a job card on page {page}: {e}", exc_info=True
-                    )  # Include traceback
-
-            # Log stats for the current page
-            self.log_scraping_stats(
-                #page=page,  # Add page number to stats
-                jobs_found=len(job_listings),
-                search_params={
-                    "job_category": job_category,
-                    "category_path": category_path,
-                    "job_type": job_type,
-                    "sortmode": sortmode_value,
-                },
-            )
+        Returns:
+            List of Job objects found on the page.
+        """
+        job_category = kwargs.get("job_category")
+        job_type = kwargs.get("job_type")
+        page = kwargs.get("page", 1)
 
-            return job_listings
+        job_listings = []
+        # Find job cards (Selector needs verification against actual JobsDB HTML)
+        # Common patterns: article, div with data-job-id, li elements
+        soup = BeautifulSoup(html, SEARCH_HTML_PARSER, parse_only=JOB_CARD_STRAINER)
+        job_cards = _JOB_CARD_SELECTOR.select(soup)
+        if not job_cards:
+            # Try alternative selectors if the primary one fails
+            soup = BeautifulSoup(html, SEARCH_HTML_PARSER, parse_only=ALT_JOB_CARD_STRAINER)
+            job_cards = _ALT_JOB_CARD_SELECTOR.select(soup)  # Example alternative
+            if not job_cards:
+                logger.warning(
+                    f"Could not find job cards on page {page} using selectors. Check HTML structure."
+                )
+                # Maybe log soup.prettify() here for debugging if needed (careful with size)
+
+        # logger.info(f"Found {len(job_cards)} potential job cards on page {page}.")
+
+        for card in job_cards:
+            try:
+                job = self._parse_job_card(card, job_category, job_type)
+                if job:
+                    # Basic validation before adding
+                    if job.id and job.name and job.company_name:
+                        job_listings.append(job)
+                    else:
+                        logger.warning(
+                            f"Parsed job card missing essential info (ID/Name/Company): {job.id}, {job.name}"
+                        )
+            except Exception as e:
+                # Log error for specific card parsing failure but continue with others
+                logger.error(
+                    f"Error parsing a job card on page {page}: {e}", exc_info=True
+                )  # Include traceback
+
+        # Log stats for the current page
+        self.log_scraping_stats(
+            #page=page,  # Add page number to stats
+            jobs_found=len(job_listings),
+            search_params={
+                "job_category": job_category,
+                "job_type": job_type,
+                "sortmode": kwargs.get("sortmode", "listed_date"),
+                "page": page,
+            },
+        )
 
-        except Exception as e:
-            logger.error(
-                f"Error searching jobs on JobsDB page {page}: {e}", exc_info=True
-            )
-            return []
+        return job_listings
 
     def get_job_details(self, job_id: str) -> Optional[Job]:
         """Get detailed information (primarily description) for a specific job.
@@ -227,28 +496,7 @@ class JobsdbScraper(BaseScraper):
                 logger.error(f"Failed to get soup object for job details: {job_id}")
                 return None  # Critical failure if soup is None
 
-            # Extract job description (Selector needs verification)
-            # Common selectors: div[class*="description"], div[id*="description"], section[class*="content"]
-            description_element = soup.select_one(
-                'div[data-automation="jobAdDetails"] ._1apz9us0'
-            )  # Example selector, needs verification
-            if not description_element:
-                # Try alternative selectors
-                description_element = soup.select_one("div.job-description")
-                if not description_element:
-                    logger.warning(
-                        f"Could not find description element for job ID: {job_id}. Check selectors."
-                    )
-                    description = "N/A"  # Fallback if no description found
-                else:
-                    description = description_element.get_text(
-                        separator="\\n", strip=True
-                    )  # Get text, preserve line breaks somewhat
-            else:
-                description = description_element.get_text(separator="\\n", strip=True)
-
-            # Basic cleaning (optional)
-            description = self.clean_text(description) if description else "N/A"
+            description = parse_job_description(soup, job_id)
 
             # Return a minimal Job object containing only the essential info updated
             return Job(
@@ -289,52 +537,52 @@ class JobsdbScraper(BaseScraper):
 
                 # Fallback: Regex (use cautiously)
                 if not job_id:
-                    html_str = str(card)
-                    # Make regex more specific if possible
-                    job_id_match = re.search(r'"jobId":"?(\d+)"?', html_str)
-                    job_id = job_id_match.group(1) if job_id_match else None
+                    job_id = _find_embedded_job_id(card)
 
             if not job_id:
                 logger.warning("Could not extract job ID from card.")
                 return None  # Cannot proceed without an ID
 
+            # Every field below is looked up in this one index of the card
+            fields = _automation_elements(card)
+
             # --- Extract Job Title ---
             title = "Unknown Title"
-            # Prioritize specific selectors, then broader ones
+            # Prioritize specific selectors, then broader ones: a jobTitle
+            # link in an h3, a link in a jobTitle div, any jobTitle link, and
+            # any h3 as a general fallback
             title_element = (
-                card.select_one('h3 a[data-automation="jobTitle"]')
-                or card.select_one('div[data-automation="jobTitle"] a')
-                or card.select_one('a[data-automation="jobTitle"]')
-                or card.select_one("h3")
-            )  # General fallback
+                fields.get(("h3 a", "jobTitle"))
+                or fields.get(("div a", "jobTitle"))
+                or fields.get(("a", "jobTitle"))
+                or card.find("h3")
+            )
             if title_element:
                 title = self.clean_text(title_element.get_text())
 
             # --- Extract Company Name ---
             company_name = "Unknown Company"
-            company_element = card.select_one(
-                'a[data-automation="jobCompany"]'
-            ) or card.select_one(
-                'span[data-automation="jobCompany"]'
+            company_element = fields.get(("a", "jobCompany")) or fields.get(
+                ("span", "jobCompany")
             )  # Alternative
             if company_element:
                 company_name = self.clean_text(company_element.get_text())
 
             # --- Extract Location ---
             location = "Unknown Location"
-            location_element = card.select_one('span[data-automation="jobLocation"]')
+            location_element = fields.get(("span", "jobLocation"))
             if location_element:
                 location = self.clean_text(location_element.get_text())
 
             # --- Extract Salary ---
             salary = "N/A"
-            salary_element = card.select_one('span[data-automation="jobSalary"]')
+            salary_element = fields.get(("span", "jobSalary"))
             if salary_element:
                 salary = self.clean_text(salary_element.get_text())
 
             # --- Extract Posting Date ---
             posting_date_text = "N/A"
-            date_element = card.select_one('span[data-automation="jobListingDate"]')
+            date_element = fields.get(("span", "jobListingDate"))
             if date_element:
                 posting_date_text = self.clean_text(date_element.get_text())
                 # Optional: Try parsing date_text into a datetime object here if format is consistent
@@ -343,12 +591,12 @@ class JobsdbScraper(BaseScraper):
             job = Job(
                 id=str(job_id),  # Ensure ID is string
                 name=title,
-                company_name=company_name,  # Store as string directly
-                location=location,
+                company_name=_intern(company_name),  # Store as string directly
+                location=_intern(location),
                 salary_description=salary,
                 source="JobsDB",  # Hardcoded source
                 date_scraped=datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"),  # Use UTC time for consistency
-                date_posted=posting_date_text,  # Store raw text, parse later if needed
+                date_posted=_intern(posting_date_text),  # Store raw text, parse later if needed
                 job_class=job_category,  # Store category used for search
                 work_type=job_type,  # Store type used for search
                 description=None,  # Description is fetched later
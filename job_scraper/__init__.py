@@ -5,23 +5,20 @@ import logging
 import sys
 import math
 import os
-import tempfile
-import json
 import random
 import time
 import threading
 from typing import List, Optional, Dict, Any, Union, Literal
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from enum import Enum
+from sqlalchemy.exc import SQLAlchemyError
 
 # Import existing components
 from .db.connector import DatabaseConnector
 from .scrapers.jobsdb import JobsdbScraper
 from .scrapers.linkedin import LinkedInScraper
-from scrapy.crawler import CrawlerProcess
-from scrapy.utils.project import get_project_settings
 from .models.job import Company, Job
 
 # Configure logging
@@ -33,6 +30,10 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Jobs from consecutive pages are saved together in chunks of this many rows
+SAVE_BATCH_SIZE = 1000
+
+
 class ScrapingMethod(str, Enum):
     """Supported scraping methods."""
 
@@ -464,31 +465,59 @@ class JobScraperManager:
             # "sport-recreation",
             # "trades-services",
         ]
-    
-        for current_page in range(self.config.start_page, self.config.end_page + 1):
-            logger.info(f"Scraping page {current_page} of {self.config.end_page}")
 
-            for job_class in job_classes:
-                if self.config.method == ScrapingMethod.SELENIUM:
-                    # Use Selenium-based scraper
-                    jobsdb_scraper = JobsdbScraper(headless=True, db=self.db)
-
-                # Only pass the parameters specified by the user
-                search_params = {
-                    "page": current_page,
-                    "job_class": job_class,
-                }
-
-                jobs = jobsdb_scraper.search_jobs(**search_params)
+        # Every (page, job class) search is independent; run them on up to
+        # config.workers threads and save each result as it completes
+        searches = [
+            (current_page, job_class)
+            for current_page in range(self.config.start_page, self.config.end_page + 1)
+            for job_class in job_classes
+        ]
+        max_workers = min(self.config.workers, len(searches))
+        pending_saves: List[Job] = []  # Saved in SAVE_BATCH_SIZE chunks
+        # One browser per worker thread, reused for all of its searches; the
+        # registry is local to this run so concurrent runs don't share it
+        thread_scrapers = threading.local()
+        open_scrapers: List[JobsdbScraper] = []
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                executor.submit(
+                    self._search_jobsdb_page,
+                    current_page,
+                    job_class,
+                    thread_scrapers,
+                    open_scrapers,
+                ): (current_page, job_class)
+                for current_page, job_class in searches
+            }
+            for future in as_completed(futures):
+                current_page, job_class = futures[future]
+                try:
+                    jobs = future.result()
+                except Exception as e:
+                    logger.error(
+                        f"Error scraping page {current_page} ({job_class}): {e}"
+                    )
+                    continue
 
-                # Use the save parameter to determine if we should save to database
-                if self.config.save and self.db and jobs:
-                    saved_count = self.db.save_jobs(jobs)
-                    logger.info(
-                        f"Saved {saved_count} jobs from page {current_page} to database"
-                        )
                 total_jobs += len(jobs)
+                # Use the save parameter to determine if we should save to database
+                if self.config.save and self.db:
+                    pending_saves.extend(jobs)
+                    if len(pending_saves) >= SAVE_BATCH_SIZE:
+                        self._save_jobs(pending_saves)
+                        pending_saves = []
                 jobs = []
+        finally:
+            # Don't wait for queued page searches if a save failed or the run
+            # was interrupted
+            executor.shutdown(cancel_futures=True)
+            for scraper in open_scrapers:
+                scraper.close()  # Quit the workers' browsers
+
+        if pending_saves:
+            self._save_jobs(pending_saves)
 
         logger.info(
             f"Total jobs found across pages {self.config.start_page} to {self.config.end_page}: {total_jobs}"
@@ -503,6 +532,47 @@ class JobScraperManager:
             "source_platform": self.config.source_platform,
         }
 
+    def _save_jobs(self, jobs: List[Job]) -> None:
+        """Save jobs collected from several pages in one transaction."""
+        saved_count = self.db.save_jobs(jobs)
+        logger.info(f"Saved {saved_count} of {len(jobs)} jobs to database")
+
+    def _search_jobsdb_page(
+        self,
+        current_page: int,
+        job_class: str,
+        thread_scrapers: threading.local,
+        open_scrapers: List[JobsdbScraper],
+    ) -> List[Job]:
+        """Search one JobsDB results page for one job class.
+
+        Args:
+            current_page: Results page number
+            job_class: JobsDB job class slug
+            thread_scrapers: Per-thread scraper slots for the current run
+            open_scrapers: Every scraper the current run created, for cleanup
+
+        Returns:
+            Jobs found on the page
+        """
+        logger.info(
+            f"Scraping page {current_page} of {self.config.end_page} ({job_class})"
+        )
+        jobsdb_scraper = getattr(thread_scrapers, "scraper", None)
+        if jobsdb_scraper is None:
+            # JobsdbScraper serves every method; created once per worker thread
+            jobsdb_scraper = JobsdbScraper(headless=True, db=self.db)
+            thread_scrapers.scraper = jobsdb_scraper
+            open_scrapers.append(jobsdb_scraper)  # list.append is atomic
+
+        # Only pass the parameters specified by the user
+        search_params = {
+            "page": current_page,
+            "job_class": job_class,
+        }
+
+        return jobsdb_scraper.search_jobs(**search_params)
+
     def _run_linkedin_pages(self) -> Dict[str, Any]:
         """Run page-based LinkedIn scraping."""
         total_jobs = 0
@@ -512,6 +582,7 @@ class JobScraperManager:
             linkedin_scraper = LinkedInScraper(db=self.db, headless=False)
             linkedin_scraper.login()
 
+        pending_saves: List[Job] = []  # Saved in SAVE_BATCH_SIZE chunks
         for current_page in range(self.config.start_page, self.config.end_page + 1):
             logger.info(f"Scraping page {current_page} of {self.config.end_page}")
 
@@ -526,15 +597,18 @@ class JobScraperManager:
             )  # Reuse scraper instance
 
             # Use the save parameter to determine if we should save to database
-            if self.config.save and self.db and jobs:
-                saved_count = self.db.save_jobs(jobs)
-                logger.info(
-                    f"Saved {saved_count} jobs from page {current_page} to database"
-                )
+            if self.config.save and self.db:
+                pending_saves.extend(jobs)
+                if len(pending_saves) >= SAVE_BATCH_SIZE:
+                    self._save_jobs(pending_saves)
+                    pending_saves = []
 
             total_jobs += len(jobs)
             jobs = []
 
+        if pending_saves:
+            self._save_jobs(pending_saves)
+
         logger.info(
             f"Total jobs found across pages {self.config.start_page} to {self.config.end_page}: {total_jobs}"
         )
@@ -550,6 +624,14 @@ class JobScraperManager:
 
     def _scrape_job_details(self, job_ids: List[str]) -> Dict[str, Any]:
         """Scrape details for the given job IDs."""
+        # Drop repeated IDs (order preserved) so no job is fetched twice
+        deduped = list(dict.fromkeys(job_ids or []))
+        if len(deduped) != len(job_ids or []):
+            logger.info(f"Skipped {len(job_ids) - len(deduped)} duplicate job IDs.")
+        job_ids = deduped
+        if not job_ids:
+            return {"success": False, "message": "No jobs found", "jobs_scraped": 0}
+
         max_workers = min(self.config.workers, len(job_ids))
 
         # Calculate batch size (with ceiling division to ensure all jobs are covered)
@@ -612,7 +694,8 @@ def process_job_batch(job_batch, worker_id, total_workers, save=False, source=No
 
     logger.info(f"{log_prefix} Starting batch processing of {len(job_batch)} jobs")
 
-    db = DatabaseConnector()
+    # Preview runs never write, so they don't need a database connection
+    db = DatabaseConnector() if save else None
     if source.lower() == "jobsdb":
         scraper = JobsdbScraper(headless=True, db=db)
     elif source.lower() == "linkedin":
@@ -620,13 +703,16 @@ def process_job_batch(job_batch, worker_id, total_workers, save=False, source=No
     else:
         raise ValueError(f"Unsupported source: {source}")
 
+    # Draw every job's 1-3 s anti-rate-limit delay up front from this worker's
+    # own generator, rather than calling the shared module RNG per job
+    rng = random.Random()
+    delays = [1.0 + 2.0 * rng.random() for _ in job_batch]
+
     success_count = 0
     failure_count = 0
     failure_job_ids = []
-    for idx, job_id in enumerate(job_batch):
+    for idx, (job_id, delay) in enumerate(zip(job_batch, delays)):
         try:
-            # Add random delay to avoid rate limiting
-            delay = random.uniform(1.0, 3.0)
             logger.debug(f"{log_prefix} Job {job_id} sleeping for {delay:.2f} seconds")
             time.sleep(delay)
 
@@ -643,11 +729,21 @@ def process_job_batch(job_batch, worker_id, total_workers, save=False, source=No
                 and job_details.description != "N/A"
             ):
                 if save:
-                    logger.info(f"Saving job {job_id} to database")
+                    logger.debug(f"Saving job {job_id} to database")
                     success = db.update_job_description(job_id, job_details.description)
                     if source.lower() == "linkedin":
-                        db.update_job_title(job_id, job_details.name)
-                        db.update_job_company(job_id, job_details.company_name)
+                        # Title and company share one session and commit; a
+                        # failure there must not overwrite the saved description
+                        try:
+                            with db.session_scope() as session:
+                                db.update_job_title(job_id, job_details.name, session)
+                                db.update_job_company(
+                                    job_id, job_details.company_name, session
+                                )
+                        except SQLAlchemyError as e:
+                            logger.error(
+                                f"{log_prefix} Job {job_id} title/company update failed: {e}"
+                            )
                     elif source.lower() == "jobsdb":
                         db.update_job_class(job_id, job_details.job_class)
                     if success:
@@ -658,11 +754,11 @@ def process_job_batch(job_batch, worker_id, total_workers, save=False, source=No
                 else:
                     # Preview mode
                     success_count += 1
-                    logger.info(
+                    logger.debug(
                         f"{log_prefix} ({idx+1}/{len(job_batch)}) Job {job_id} description found (preview mode)"
                     )
             else:
-                logger.warning(
+                logger.debug(
                     f"{log_prefix} ({idx+1}/{len(job_batch)}) Job {job_id} no valid description found"
                 )
                 if save:
@@ -27,18 +27,20 @@ class BaseScraper(ABC):
     browser automation, HTML parsing, and standardized data extraction.
     """
 
-    def __init__(self, name=None, base_url=None, headless=True):
+    def __init__(self, name=None, base_url=None, headless=True, use_driver=True):
         """Initialize the scraper.
 
         Args:
             name: Name of the job board/source
             base_url: Base URL for the job board
+            use_driver: Start a browser session (False for plain-HTTP scraping)
         """
         self.name = name
         self.base_url = base_url
         self.headless = headless
         self.driver = None
-        self._setup_driver()
+        if use_driver:
+            self._setup_driver()
 
     def _setup_driver(self, headless=True):
         """Set up the Selenium WebDriver.
@@ -73,10 +75,17 @@ class BaseScraper(ABC):
             options=options,
         )
 
+    def close(self) -> None:
+        """Quit the browser session. Safe to call more than once."""
+        if self.driver:
+            try:
+                self.driver.quit()
+            finally:
+                self.driver = None
+
     def __del__(self):
         """Clean up resources when the scraper is destroyed."""
-        if self.driver:
-            self.driver.quit()
+        self.close()
 
     def get_soup(
         self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None
@@ -91,6 +100,24 @@ class BaseScraper(ABC):
         Returns:
             BeautifulSoup object for parsing
         """
+        return BeautifulSoup(self.get_page_source(url, params, headers), "html.parser")
+
+    def get_page_source(
+        self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None
+    ) -> str:
+        """Load a URL in the browser and return the rendered HTML.
+
+        Callers that only need part of the page can parse this themselves,
+        e.g. with a SoupStrainer, instead of building a full tree via get_soup.
+
+        Args:
+            url: URL to fetch
+            params: Optional query parameters
+            headers: Optional HTTP headers
+
+        Returns:
+            Page source after loading
+        """
         try:
             # Construct URL with params if provided
             if params:
@@ -137,9 +164,7 @@ class BaseScraper(ABC):
                 except Exception as e:
                     logger.warning(f"Error handling LinkedIn expand buttons: {e}")
 
-            # Get page source and create BeautifulSoup object
-            page_source = self.driver.page_source
-            return BeautifulSoup(page_source, "html.parser")
+            return self.driver.page_source
         except Exception as e:
             logger.error(f"Error fetching URL: {url}")
             logger.error(f"Error: {e}")
@@ -1,9 +1,16 @@
 """Database connection and operations."""
 
+import io
+import json
 import logging
+import operator
 import os
-from typing import Dict, List, Optional
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import psycopg2
+from psycopg2.extras import execute_values
 import sqlalchemy as sa
 from dotenv import load_dotenv
 from sqlalchemy.exc import SQLAlchemyError
@@ -24,7 +31,15 @@ Base = declarative_base()
 
 # Define the Jobs table
 class JobModel(Base):
-    """SQLAlchemy model for jobs table."""
+    """SQLAlchemy model for jobs table.
+
+    Mirrors the table as documented in db_schema.docx: ``internal_id`` is the
+    serial primary key and ``id`` is the source site's job ID, which carries
+    no unique constraint. The backend's TypeORM entity (job.entity.ts) runs
+    with ``synchronize: false`` and does not describe this table accurately
+    (it declares ``id`` as the primary key and ``date_scraped`` as a
+    timestamp), so it is not used as the reference here.
+    """
 
     __tablename__ = "jobs"
 
@@ -51,10 +66,91 @@ class JobModel(Base):
     job_class_id = sa.Column(sa.Integer, nullable=True)
     job_subclass_id = sa.Column(sa.Integer, nullable=True)
 
+    # Lookup paths used by the scrapers' queries. Never created implicitly:
+    # create_indexes() builds missing ones CONCURRENTLY when run on purpose
+    # (--create_indexes). Not unique: jobs.id has no unique constraint.
+    __table_args__ = (
+        # Duplicate checks in save_jobs and every update by job ID
+        sa.Index("ix_jobs_id", "id", postgresql_concurrently=True),
+        # Jobs still waiting for a description, newest/oldest first: serves
+        # fetch_scrape_targets and get_jobs_with_filters("new") without a scan
+        sa.Index(
+            "ix_jobs_missing_description",
+            "internal_id",
+            postgresql_where=sa.text("description IS NULL OR description = ''"),
+            postgresql_concurrently=True,
+        ),
+        # get_jobs / iter_jobs order by date_scraped
+        sa.Index("ix_jobs_date_scraped", "date_scraped", postgresql_concurrently=True),
+    )
+
+
+# Columns written by save_jobs and copy_jobs, in row order
+JOB_INSERT_COLUMNS = (
+    "id",
+    "description",
+    "company_name",
+    "name",
+    "location",
+    "work_type",
+    "salary_description",
+    "date_posted",
+    "date_scraped",
+    "source",
+    "other",
+    "remark",
+    "job_class",
+    "job_subclass",
+)
+
+
+# Columns returned by get_jobs/iter_jobs when none are requested
+JOB_DICT_COLUMNS = ("internal_id",) + JOB_INSERT_COLUMNS
+
+# Reads every insert column off a Job in one C-level call
+_job_row_getter = operator.attrgetter(*JOB_INSERT_COLUMNS)
+
+# Pooled connections older than this are reopened on checkout
+POOL_RECYCLE_SECONDS = 1800
+
+# Seconds a get_jobs result is reused for an identical query
+GET_JOBS_CACHE_TTL = 60
+GET_JOBS_CACHE_SIZE = 256
+
+# Transaction-level advisory lock taken by save_jobs/copy_jobs: jobs.id has
+# no unique constraint, so ON CONFLICT can't be used and concurrent writers
+# are serialized around the "skip IDs already stored" check instead
+JOBS_INSERT_LOCK_ID = 0x6A6F6273  # "jobs"
+
+# save_jobs switches from INSERT ... VALUES to COPY at this many unique rows;
+# below the callers' 1000-row save batches so full batches are COPYed
+COPY_THRESHOLD = 500
+
+
+def _copy_text(value) -> str:
+    """Format one value for COPY's text format (NULL as \\N, specials escaped)."""
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
 
 class DatabaseConnector:
-    def __init__(self):
-        """Initialize database connection."""
+    def __init__(self, pool_size: Optional[int] = None):
+        """Initialize database connection.
+
+        Args:
+            pool_size: Optional size of the engine's connection pool. Set this
+                when the connector is shared between worker threads so every
+                worker can hold a connection at the same time. The pool may
+                grow to twice this size for short bursts (e.g. a writer thread
+                flushing while every worker holds a connection).
+        """
         try:
             # Get database connection string from environment variables or use default
             db_host = os.environ.get("DB_HOST", "localhost")
@@ -63,9 +159,23 @@ class DatabaseConnector:
             db_password = os.environ.get("DB_PASSWORD", "admin")
             db_port = os.environ.get("DB_PORT", "5432")
 
-            # Create SQLAlchemy engine
+            # Create SQLAlchemy engine (its QueuePool is thread-safe)
+            engine_kwargs = {
+                # Replace connections the server closed while the pool sat
+                # idle, and retire them before server/proxy idle timeouts hit
+                "pool_pre_ping": True,
+                "pool_recycle": POOL_RECYCLE_SECONDS,
+            }
+            if pool_size is not None:
+                engine_kwargs["pool_size"] = pool_size
+                engine_kwargs["max_overflow"] = pool_size
             self.engine = create_engine(
-                f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+                f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}",
+                # Let psycopg2 send ORM executemany() calls as multi-row
+                # VALUES / batched statements instead of one per row
+                executemany_mode="values_plus_batch",
+                executemany_batch_page_size=500,
+                **engine_kwargs,
             )
 
             # Create session factory - this was missing
@@ -74,6 +184,10 @@ class DatabaseConnector:
             # Create a raw connection for other operations
             self.connection = self.engine.raw_connection()
 
+            # get_jobs results keyed by query; every write method clears it
+            # after committing so reads never outlive a change made here
+            self._jobs_cache: Dict[str, Tuple[float, List[Dict]]] = {}
+
             logger.info("Database connection established successfully")
         except Exception as e:
             logger.error(f"Error connecting to database: {e}")
@@ -82,60 +196,351 @@ class DatabaseConnector:
             self.Session = None
             raise
 
-    def get_existing_job_ids(self):
-        """Get a list of all existing job IDs in the database."""
+    @contextmanager
+    def session_scope(self) -> Iterator[Session]:
+        """Provide one session for a group of operations.
+
+        The session (and its pooled connection) is shared by everything in the
+        ``with`` block and committed once on exit, or rolled back if the block
+        raises. Pass it to the ``update_job_*`` methods to group their writes.
+
+        Yields:
+            An open SQLAlchemy session
+        """
+        session = self.Session()
+        try:
+            yield session
+            session.commit()
+            self._jobs_cache.clear()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def create_indexes(self) -> None:
+        """Build the jobs indexes declared on JobModel that don't exist yet.
+
+        A maintenance step, run only on request (``--create_indexes``), never
+        when the scraper starts. Each index is built with CREATE INDEX
+        CONCURRENTLY so scrapers and the backend can keep writing meanwhile.
+        Existing indexes are left alone. A build that fails part way leaves an
+        INVALID index, which must be dropped before running this again.
+        """
+        # CONCURRENTLY can't run inside a transaction block
+        with self.engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as conn:
+            for index in JobModel.__table__.indexes:
+                try:
+                    logger.info(f"Creating index {index.name} if missing...")
+                    index.create(bind=conn, checkfirst=True)
+                except SQLAlchemyError as e:
+                    logger.error(f"Could not create index {index.name}: {e}")
+
+    def get_existing_job_ids(self, job_ids: Optional[List] = None):
+        """Get a list of existing job IDs in the database.
+
+        Args:
+            job_ids: Only look up these IDs (one ``IN`` query) instead of
+                loading every ID in the table
+        """
         from sqlalchemy.orm import Session
 
         with Session(self.engine) as session:
             try:
                 # Query just the ID column for efficiency
-                results = session.query(JobModel.id).all()
+                query = session.query(JobModel.id)
+                if job_ids is not None:
+                    if not job_ids:
+                        return []
+                    query = query.filter(JobModel.id.in_([str(j) for j in job_ids]))
+                results = query.all()
                 # Convert from list of tuples to list of strings
                 return [str(r[0]) for r in results]
             except Exception as e:
                 logger.error(f"Error getting existing job IDs: {e}")
                 return []
 
-    def save_jobs(self, jobs: List[Job]) -> int:
-        """Save jobs to database."""
-        if not self.Session:
-            logger.error("Cannot save jobs: No database session available")
+    def get_existing_descriptions(self, job_ids: List) -> Dict[str, bool]:
+        """Check which of the given jobs already have a description stored.
+
+        Args:
+            job_ids: Job IDs to look up
+
+        Returns:
+            Mapping of job ID (as string) to True for every job whose description
+            is already populated; IDs without a description are absent
+        """
+        if not job_ids:
+            return {}
+
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT id FROM jobs WHERE id = ANY(%s) "
+                    "AND description IS NOT NULL AND description <> 'N/A'",
+                    ([str(job_id) for job_id in job_ids],),
+                )
+                existing = {row[0]: True for row in cursor.fetchall()}
+            self.connection.commit()  # Don't leave the connection idle in transaction
+            return existing
+        except psycopg2.Error as e:
+            self.connection.rollback()
+            logger.error(f"Error checking existing descriptions: {e}")
+            return {}
+
+    def fetch_scrape_targets(
+        self,
+        start_id: Optional[int] = None,
+        end_id: Optional[int] = None,
+        null_only: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """Select the job IDs whose details should be scraped, in one query.
+
+        Args:
+            start_id: Lowest internal_id to include (ignored unless end_id is set)
+            end_id: Highest internal_id to include
+            null_only: Only return jobs without a description yet
+            limit: Maximum number of IDs to return (default: no limit)
+
+        Returns:
+            Job IDs ordered by internal_id, or an empty list on failure
+        """
+        use_range = start_id is not None and end_id is not None
+        try:
+            # Named (server-side) cursor: IDs are streamed in chunks of itersize
+            with self.connection.cursor(name="scrape_targets") as cursor:
+                cursor.itersize = 1000
+                cursor.execute(
+                    "SELECT id FROM jobs "
+                    "WHERE (NOT %(use_range)s OR internal_id BETWEEN %(start)s AND %(end)s) "
+                    "AND (NOT %(null_only)s OR description IS NULL OR description = '') "
+                    "ORDER BY internal_id LIMIT %(limit)s",
+                    {
+                        "use_range": use_range,
+                        "start": start_id,
+                        "end": end_id,
+                        "null_only": null_only,
+                        "limit": limit,  # LIMIT NULL means no limit
+                    },
+                )
+                job_ids = [row[0] for row in cursor]
+            self.connection.commit()  # Close the cursor's transaction
+            return job_ids
+        except psycopg2.Error as e:
+            self.connection.rollback()
+            logger.error(f"Error fetching jobs to scrape: {e}")
+            return []
+
+    def save_jobs(self, jobs: List[Union[Job, Dict]], page_size: int = 1000) -> int:
+        """Save jobs to database.
+
+        New rows are written with multi-row INSERTs in a single transaction.
+        Batches of at least COPY_THRESHOLD jobs are loaded with COPY through a
+        staging table instead (see _copy_rows). Jobs whose ID is already stored
+        (or repeated within ``jobs``) are skipped; concurrent saves are
+        serialized so two writers can't both insert the same new ID.
+
+        Args:
+            jobs: Jobs to save, as Job objects or dicts keyed by column name
+            page_size: Number of rows per INSERT statement
+
+        Returns:
+            Number of jobs inserted, or 0 on failure
+        """
+        if not self.engine:
+            logger.error("Cannot save jobs: No database engine available")
             return 0
 
-        session = self.Session()
+        rows = self._unique_rows(jobs)
+        if not rows:
+            return 0
+
+        connection = self.engine.raw_connection()
         try:
-            saved_count = 0
-            for job in jobs:
-                # Convert to SQLAlchemy model
-                job_model = self._convert_to_model(job)
-                # Before saving job
-             
-                session.add(job_model)
-                saved_count += 1
+            with connection.cursor() as cursor:
+                self._lock_job_inserts(cursor)
+                if len(rows) >= COPY_THRESHOLD:
+                    inserted = self._copy_rows(cursor, rows)  # Skip INSERT parsing
+                else:
+                    self._drop_existing_rows(cursor, rows)
+                    if rows:
+                        execute_values(
+                            cursor,
+                            f"INSERT INTO jobs ({', '.join(JOB_INSERT_COLUMNS)}) VALUES %s",
+                            list(rows.values()),
+                            page_size=page_size,
+                        )
+                    inserted = len(rows)
 
-            session.commit()
-            return saved_count
-        except Exception as e:
-            session.rollback()
+            connection.commit()
+            self._jobs_cache.clear()
+            return inserted
+        except psycopg2.Error as e:
+            connection.rollback()
             logger.error(f"Error saving jobs to database: {e}")
             return 0
         finally:
-            session.close()
+            connection.close()
+
+    def copy_jobs(self, jobs: List[Union[Job, Dict]]) -> int:
+        """Save jobs to database with a single COPY FROM STDIN.
+
+        Faster than save_jobs for large multi-page crawls since the server
+        does not parse an INSERT per batch. Existing/repeated IDs are skipped
+        the same way, on the server (see _copy_rows).
+
+        Args:
+            jobs: Jobs to save, as Job objects or dicts keyed by column name
+
+        Returns:
+            Number of jobs inserted, or 0 on failure
+        """
+        if not self.engine:
+            logger.error("Cannot save jobs: No database engine available")
+            return 0
 
-    def get_jobs(self, filters: Optional[Dict] = None, limit: int = 100) -> List[Dict]:
+        rows = self._unique_rows(jobs)
+        if not rows:
+            return 0
+
+        connection = self.engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                self._lock_job_inserts(cursor)
+                inserted = self._copy_rows(cursor, rows)
+
+            connection.commit()
+            self._jobs_cache.clear()
+            return inserted
+        except psycopg2.Error as e:
+            connection.rollback()
+            logger.error(f"Error copying jobs to database: {e}")
+            return 0
+        finally:
+            connection.close()
+
+    def _copy_rows(self, cursor, rows: Dict[str, Tuple]) -> int:
+        """Insert rows whose ID isn't stored yet, loading them with COPY.
+
+        Rows are COPYed (text format) into a temporary staging table and moved
+        into jobs by one INSERT ... SELECT that skips IDs already present, so
+        no separate existence query or ID list round trip is needed. The
+        staging table has a unique name and is dropped at commit, so repeated
+        calls on one connection or transaction don't collide.
+
+        Returns:
+            Number of rows inserted into jobs
+        """
+        columns = ", ".join(JOB_INSERT_COLUMNS)
+        staging = f"staged_jobs_{uuid.uuid4().hex}"
+        cursor.execute(
+            f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+            f"SELECT {columns} FROM jobs WITH NO DATA"
+        )
+        buffer = io.StringIO()
+        for row in rows.values():
+            buffer.write("\t".join(map(_copy_text, row)))
+            buffer.write("\n")
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY {staging} ({columns}) FROM STDIN", buffer)
+        cursor.execute(
+            f"INSERT INTO jobs ({columns}) SELECT {columns} FROM {staging} AS s "
+            "WHERE NOT EXISTS (SELECT 1 FROM jobs AS j WHERE j.id = s.id)"
+        )
+        return cursor.rowcount
+
+    def _unique_rows(self, jobs: List[Union[Job, Dict]]) -> Dict[str, Tuple]:
+        """Convert jobs to insert rows keyed by ID; the last duplicate wins."""
+        rows = {}
+        for job in jobs:
+            row = self._convert_to_row(job)
+            rows[row[0]] = row
+        return rows
+
+    def _lock_job_inserts(self, cursor) -> None:
+        """Serialize job inserts until the current transaction ends.
+
+        Without it, two writers could both find an ID missing and both insert it.
+        """
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (JOBS_INSERT_LOCK_ID,))
+
+    def _drop_existing_rows(self, cursor, rows: Dict[str, Tuple]) -> None:
+        """Remove rows whose job ID is already stored, using one query."""
+        cursor.execute("SELECT id FROM jobs WHERE id = ANY(%s)", (list(rows),))
+        for (existing_id,) in cursor.fetchall():
+            rows.pop(existing_id, None)
+
+    def get_jobs(
+        self,
+        filters: Optional[Dict] = None,
+        limit: int = 100,
+        columns: Optional[List[str]] = None,
+    ) -> List[Dict]:
         """Get jobs from database with optional filters.
 
         Args:
             filters: Dictionary of filter criteria
             limit: Maximum number of jobs to return
+            columns: Only load these jobs columns (e.g. leave out the large
+                description/other/remark text for listings); default:
+                JOB_DICT_COLUMNS
 
         Returns:
-            List of jobs as dictionaries
+            List of jobs as dictionaries. Identical queries within
+            GET_JOBS_CACHE_TTL seconds are answered from memory.
         """
+        cache_key = json.dumps([filters, limit, columns], sort_keys=True, default=str)
+        cached = self._jobs_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < GET_JOBS_CACHE_TTL:
+            return [dict(job) for job in cached[1]]  # Copies; callers may mutate
+
+        try:
+            results = list(self.iter_jobs(filters, limit, columns))
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting jobs from database: {e}")
+            return []
+
+        if len(self._jobs_cache) >= GET_JOBS_CACHE_SIZE:
+            self._jobs_cache.clear()  # Bound memory for many distinct queries
+        self._jobs_cache[cache_key] = (time.monotonic(), results)
+        return [dict(job) for job in results]
+
+    def iter_jobs(
+        self,
+        filters: Optional[Dict] = None,
+        limit: Optional[int] = 100,
+        columns: Optional[List[str]] = None,
+        chunk_size: int = 500,
+    ) -> Iterator[Dict]:
+        """Yield jobs matching the same filters as get_jobs, one at a time.
+
+        Rows are streamed from a server-side cursor ``chunk_size`` at a time,
+        so large exports never hold the whole result in memory. Unlike
+        get_jobs, results are not cached and database errors are raised.
+
+        Args:
+            filters: Dictionary of filter criteria (see get_jobs)
+            limit: Maximum number of jobs to yield (None: no limit)
+            columns: Only load these jobs columns; default: JOB_DICT_COLUMNS
+            chunk_size: Rows fetched from the server per round trip
+
+        Yields:
+            Jobs as dictionaries, newest first
+        """
+        columns = columns or JOB_DICT_COLUMNS
+        unknown = set(columns) - set(JobModel.__table__.c.keys())
+        if unknown:
+            raise ValueError(f"Unknown jobs columns: {sorted(unknown)}")
+        # Plain column rows: no ORM instances or identity map per job
+        selected = [JobModel.__table__.c[name] for name in columns]
+
         session = self.Session()
 
         try:
-            query = session.query(JobModel)
+            query = session.query(*selected)
 
             # Apply filters if provided
             if filters:
@@ -162,15 +567,16 @@ class DatabaseConnector:
                 if "job_class" in filters:
                     query = query.filter(JobModel.job_class == filters["job_class"])
 
-            # Apply limit and get results
-            jobs = query.order_by(JobModel.date_scraped.desc()).limit(limit).all()
+            # Apply limit and stream the results
+            query = (
+                query.order_by(JobModel.date_scraped.desc())
+                .limit(limit)
+                .execution_options(stream_results=True)
+                .yield_per(chunk_size)
+            )
 
-            # Convert SQLAlchemy models to dictionaries
-            return [self._convert_to_dict(job) for job in jobs]
-
-        except SQLAlchemyError as e:
-            logger.error(f"Error getting jobs from database: {e}")
-            return []
+            for row in query:
+                yield dict(row._mapping)
 
         finally:
             session.close()
@@ -274,94 +680,32 @@ class DatabaseConnector:
             logger.error(f"Error fetching source platforms: {e}")
             return []
 
-    def _convert_to_model(self, job: Job) -> JobModel:
-        """Convert Pydantic Job model to SQLAlchemy JobModel.
+    def _convert_to_row(self, job: Union[Job, Dict]) -> Tuple:
+        """Convert a Job (or column dict) to a tuple ordered like JOB_INSERT_COLUMNS.
 
         Args:
-            job: Pydantic Job object
+            job: Pydantic Job object or dict keyed by column name; missing
+                dict keys are stored as NULL
 
         Returns:
-            SQLAlchemy JobModel
+            Row values for a raw INSERT
         """
-        job_model = JobModel(
-            id=job.id,
-            description=job.description,
-            company_name=job.company_name,
-            name=job.name,
-            location=job.location,
-            work_type=job.work_type,
-            salary_description=job.salary_description,
-            date_posted=job.date_posted,
-            date_scraped=job.date_scraped,
-            source=job.source,
-            other=job.other,
-            remark=job.remark,
-            job_class=job.job_class,
-            job_subclass=job.job_subclass,
-        )
-
-        # Only set ID if it exists (for updates)
-        # if job.id is not None:
-        #     job_model.id = job.id
+        if isinstance(job, dict):
+            return tuple(map(job.get, JOB_INSERT_COLUMNS))
+        return _job_row_getter(job)
 
-        return job_model
+    def update_job_class(
+        self, job_id: str, job_class: str, session: Optional[Session] = None
+    ) -> bool:
+        """Set the job class of a job (see _update_job_fields for ``session``)."""
+        return self._update_job_fields(job_id, {"job_class": job_class}, "class", session)
 
-    def _convert_to_dict(self, job_model: JobModel) -> Dict:
-        """Convert SQLAlchemy JobModel to dictionary.
-
-        Args:
-            job_model: SQLAlchemy JobModel
-
-        Returns:
-            Job as dictionary
-        """
-        return {
-            "internal_id": job_model.internal_id,
-            "id": job_model.id,
-            "description": job_model.description,
-            "company_name": job_model.company_name,
-            "name": job_model.name,
-            "location": job_model.location,
-            "work_type": job_model.work_type,
-            "salary_description": job_model.salary_description,
-            "date_posted": job_model.date_posted,
-            "date_scraped": job_model.date_scraped,
-            "source": job_model.source,
-            "other": job_model.other,
-            "remark": job_model.remark,
-            "job_class": job_model.job_class,
-            "job_subclass": job_model.job_subclass,
-        }
-
-
-    def update_job_class(self, job_id: str, job_class: str) -> bool:
-        session = self.Session()
-
-        try:
-            # Find the job by ID
-            job = session.query(JobModel).filter(JobModel.id == job_id).first()
-
-            if not job:
-                logger.error(f"Job with ID {job_id} not found")
-                return False
-
-            job.job_class = job_class
-
-            # Commit the changes
-            session.commit()
-            return True
-
-        except SQLAlchemyError as e:
-            session.rollback()
-            logger.error(f"Error updating job class: {e}")
-            return False
-
-        finally:
-            session.close()
-    
     def update_job_description(self, job_id: str, description: str) -> bool:
         """Update the description for a specific job.
 
+        A single-row call to bulk_update_descriptions, so the update is one
+        statement rather than an ORM load followed by a flush.
+
         Args:
             job_id: Job ID to update
             description: New job description
@@ -369,82 +713,124 @@ class DatabaseConnector:
         Returns:
             True if successful, False otherwise
         """
-        session = self.Session()
-
-        try:
-            # Find the job by ID
-            job = session.query(JobModel).filter(JobModel.id == job_id).first()
-
-            if not job:
-                # logger.error(f"Job with ID {job_id} not found")
-                return False
-
-            # Update the description
-            job.description = description
-
-            # Commit the changes
-            session.commit()
-            # logger.info(f"Updated description for job ID {job_id}")
+        if self.bulk_update_descriptions([(job_id, description)]):
             return True
 
-        except SQLAlchemyError as e:
-            session.rollback()
+        # Nothing changed: the job is missing, the update failed (logged by
+        # bulk_update_descriptions), or the row already holds this description
+        connection = self.engine.raw_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM jobs WHERE id = %s AND description IS NOT DISTINCT FROM %s",
+                    (str(job_id), description),
+                )
+                return cursor.fetchone() is not None
+        except psycopg2.Error as e:
             logger.error(f"Error updating job description: {e}")
             return False
-
         finally:
-            session.close()
+            connection.close()
 
-    def update_job_title(self, job_id: str, title: str) -> bool:
-        session = self.Session()
+    def bulk_update_descriptions(
+        self, updates: List[Tuple[str, str]], page_size: int = 1000
+    ) -> int:
+        """Update the descriptions of many jobs in a single transaction.
 
-        try:
-            # Find the job by ID
-            job = session.query(JobModel).filter(JobModel.id == job_id).first()
+        Each page of updates is sent as one ``UPDATE ... FROM (VALUES ...)``
+        statement instead of one UPDATE per job. Rows that already hold the
+        given description (e.g. "N/A" from an earlier run) are not rewritten.
 
-            if not job:
-                logger.error(f"Job with ID {job_id} not found")
-                return False
+        Args:
+            updates: List of (job_id, description) pairs
+            page_size: Maximum number of rows per UPDATE statement
 
-            # Update the description
-            job.name = title
+        Returns:
+            Number of rows changed, or 0 on failure
+        """
+        if not updates:
+            return 0
 
-            # Commit the changes
-            session.commit()
-            # logger.info(f"Updated description for job ID {job_id}")
-            return True
+        connection = self.engine.raw_connection()
+        try:
+            updated = 0
+            with connection.cursor() as cursor:
+                for start in range(0, len(updates), page_size):
+                    batch = [
+                        (str(job_id), description)
+                        for job_id, description in updates[start : start + page_size]
+                    ]
+                    execute_values(
+                        cursor,
+                        "UPDATE jobs AS j SET description = v.description "
+                        "FROM (VALUES %s) AS v(id, description) WHERE j.id = v.id "
+                        "AND j.description IS DISTINCT FROM v.description",
+                        batch,
+                        page_size=page_size,
+                    )
+                    updated += cursor.rowcount
 
-        except SQLAlchemyError as e:
-            session.rollback()
-            logger.error(f"Error updating job title: {e}")
-            return False
+            connection.commit()
+            self._jobs_cache.clear()
+            return updated
 
-        finally:
-            session.close()
+        except psycopg2.Error as e:
+            connection.rollback()
+            logger.error(f"Error bulk updating job descriptions: {e}")
+            return 0
 
-    def update_job_company(self, job_id: str, company_name: str) -> bool:
-        session = self.Session()
+        finally:
+            connection.close()
+
+    def update_job_title(
+        self, job_id: str, title: str, session: Optional[Session] = None
+    ) -> bool:
+        """Set the title of a job (see _update_job_fields for ``session``)."""
+        return self._update_job_fields(job_id, {"name": title}, "title", session)
+
+    def update_job_company(
+        self, job_id: str, company_name: str, session: Optional[Session] = None
+    ) -> bool:
+        """Set the company of a job (see _update_job_fields for ``session``)."""
+        return self._update_job_fields(
+            job_id, {"company_name": company_name}, "company", session
+        )
 
-        try:
-            # Find the job by ID
-            job = session.query(JobModel).filter(JobModel.id == job_id).first()
+    def _update_job_fields(
+        self, job_id: str, values: Dict, label: str, session: Optional[Session]
+    ) -> bool:
+        """Update columns of one job with a single UPDATE statement.
 
-            if not job:
-                logger.error(f"Job with ID {job_id} not found")
-                return False
+        Without ``session`` the update runs and commits in its own session and
+        errors are logged. With a session from session_scope the update joins
+        that transaction, and errors propagate so the scope rolls back.
 
-            # Update the description
-            job.company_name = company_name
+        Args:
+            job_id: Job ID to update
+            values: Column name -> new value
+            label: What is being updated, for log messages
+            session: Optional session to run in (committed by its owner)
 
-            # Commit the changes
-            session.commit()
-            # logger.info(f"Updated description for job ID {job_id}")
-            return True
+        Returns:
+            True if the job was found and updated, False otherwise
+        """
+        if session is not None:
+            return self._set_job_fields(session, job_id, values)
 
+        try:
+            with self.session_scope() as session:
+                return self._set_job_fields(session, job_id, values)
         except SQLAlchemyError as e:
-            session.rollback()
-            logger.error(f"Error updating job company: {e}")
+            logger.error(f"Error updating job {label}: {e}")
             return False
 
-        finally:
-            session.close()
+    def _set_job_fields(self, session: Session, job_id: str, values: Dict) -> bool:
+        updated = (
+            session.query(JobModel)
+            .filter(JobModel.id == job_id)
+            .update(values, synchronize_session=False)
+        )
+        if not updated:
+            logger.error(f"Job with ID {job_id} not found")
+            return False
+        return True
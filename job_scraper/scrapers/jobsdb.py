@@ -83,13 +83,6 @@ class JobsdbScraper(BaseScraper):
         params = {"sortmode": "ListedDate", "page": page}
         
         try:
-            existing_ids = []
-            if self.db:  # Make sure db connection exists
-                existing_ids = self.db.get_existing_job_ids()
-            else:
-                logger.warning(
-                    "No database connection available, skipping duplicate check"
-                )
             logger.info(f"{search_url} - Searching for jobs in {kwargs.get('job_class')}")
             soup = self.get_soup(search_url, params=params)
             # filename_prefix = f"jobsdb_{job_class}_page{page}"
@@ -101,12 +94,23 @@ class JobsdbScraper(BaseScraper):
                 try:
                     job = self._parse_job_card(card)
                     if job:
-                        if str(job.id) in existing_ids:
-                            continue
                         job_listings.append(job)
                 except Exception as e:
                     logger.error(f"Error parsing job card: {e}")
 
+            # Check only this page's IDs against the database, in one query
+            if self.db:  # Make sure db connection exists
+                existing_ids = set(
+                    self.db.get_existing_job_ids([job.id for job in job_listings])
+                )
+                job_listings = [
+                    job for job in job_listings if str(job.id) not in existing_ids
+                ]
+            else:
+                logger.warning(
+                    "No database connection available, skipping duplicate check"
+                )
+
             self.log_scraping_stats(
                 jobs_found=len(job_listings),
                 search_params={
@@ -101,9 +101,10 @@ class LinkedInScraper(BaseScraper):
             job_ids = [card.get("data-occludable-job-id") for card in job_cards]
 
             # Get list of existing job IDs from database
-            existing_ids = []
+            existing_ids = set()
             if self.db:  # Make sure db connection exists
-                existing_ids = self.db.get_existing_job_ids()
+                # Look up only this page's IDs, in one query
+                existing_ids = set(self.db.get_existing_job_ids(job_ids))
             else:
                 logger.warning(
                     "No database connection available, skipping duplicate check"